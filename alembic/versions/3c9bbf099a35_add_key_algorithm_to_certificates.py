@@ -0,0 +1,44 @@
+"""add key_algorithm to certificates
+
+Revision ID: 3c9bbf099a35
+Revises: 5d043ffc3982
+Create Date: 2026-10-15 23:22:41.583763
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9bbf099a35"
+down_revision: str | Sequence[str] | None = "5d043ffc3982"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+key_algorithm = sa.Enum("RSA", "ECDSA_P256", "ED25519", name="keyalgorithm")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Adding a column does not emit CREATE TYPE on PostgreSQL
+    key_algorithm.create(op.get_bind(), checkfirst=True)
+    with op.batch_alter_table("certificates", schema=None) as batch_op:
+        # Every certificate issued so far has an RSA key
+        batch_op.add_column(
+            sa.Column(
+                "key_algorithm",
+                key_algorithm,
+                nullable=False,
+                server_default="RSA",
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("certificates", schema=None) as batch_op:
+        batch_op.drop_column("key_algorithm")
+    key_algorithm.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,69 @@
+"""add indexes on foreign key filter columns
+
+Revision ID: 5d043ffc3982
+Revises: b978e2eebd16
+Create Date: 2026-10-15 23:14:38.750380
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d043ffc3982"
+down_revision: str | Sequence[str] | None = "b978e2eebd16"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("certificate_authorities", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_certificate_authorities_organization_id"),
+            ["organization_id"],
+            unique=False,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_certificate_authorities_parent_ca_id"),
+            ["parent_ca_id"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("certificates", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_certificates_issuer_id"), ["issuer_id"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_certificates_organization_id"),
+            ["organization_id"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("crl_entries", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_crl_entries_ca_id"), ["ca_id"], unique=False
+        )
+
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_users_organization_id"), ["organization_id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_users_organization_id"))
+
+    with op.batch_alter_table("crl_entries", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_crl_entries_ca_id"))
+
+    with op.batch_alter_table("certificates", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_certificates_organization_id"))
+        batch_op.drop_index(batch_op.f("ix_certificates_issuer_id"))
+
+    with op.batch_alter_table("certificate_authorities", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_certificate_authorities_parent_ca_id"))
+        batch_op.drop_index(batch_op.f("ix_certificate_authorities_organization_id"))
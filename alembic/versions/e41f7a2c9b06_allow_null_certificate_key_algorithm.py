@@ -0,0 +1,48 @@
+"""allow null certificate key_algorithm
+
+Revision ID: e41f7a2c9b06
+Revises: 3c9bbf099a35
+Create Date: 2026-10-16 09:12:05.418227
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e41f7a2c9b06"
+down_revision: str | Sequence[str] | None = "3c9bbf099a35"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+key_algorithm = sa.Enum("RSA", "ECDSA_P256", "ED25519", name="keyalgorithm")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CSR keys that KeyAlgorithm cannot name (other EC curves, Ed448, DSA)
+    with op.batch_alter_table("certificates", schema=None) as batch_op:
+        batch_op.alter_column(
+            "key_algorithm",
+            existing_type=key_algorithm,
+            nullable=True,
+            existing_server_default="RSA",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The settings default was recorded for these keys before the column allowed NULL
+    op.execute(
+        "UPDATE certificates SET key_algorithm = 'RSA' WHERE key_algorithm IS NULL"
+    )
+    with op.batch_alter_table("certificates", schema=None) as batch_op:
+        batch_op.alter_column(
+            "key_algorithm",
+            existing_type=key_algorithm,
+            nullable=False,
+            existing_server_default="RSA",
+        )
@@ -15,7 +15,7 @@ from app.db.session import get_session
 from app.schemas.user import RefreshTokenRequest, Token, TokenPayload
 from app.services.audit import AuditService
 from app.services.token import TokenService
-from app.services.user import UserService
+from app.services.user import UserService, invalidate_cached_user
 
 router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)
@@ -146,3 +146,4 @@ async def invalidate_all_tokens(
     await token_service.revoke_all_user_refresh_tokens(user_id=current_user.id)
 
     await db.commit()
+    invalidate_cached_user(current_user.id)
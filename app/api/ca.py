@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user
@@ -76,15 +76,19 @@ async def create_ca(
 
 @router.get("/", response_model=list[CAResponse])
 async def read_cas(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_session),  # noqa: B008
     current_user: User = Depends(get_current_active_user),  # noqa: B008
 ) -> list[CAResponse]:
     """Get all Certificate Authorities."""
     ca_service = CAService(db)
     if current_user.role == UserRole.SUPERUSER:
-        cas = await ca_service.list_cas()
+        cas = await ca_service.list_cas(skip=skip, limit=limit)
     else:
-        cas = await ca_service.list_cas(organization_id=current_user.organization_id)
+        cas = await ca_service.list_cas(
+            organization_id=current_user.organization_id, skip=skip, limit=limit
+        )
     return cas
 
 
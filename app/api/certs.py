@@ -51,6 +51,7 @@ async def create_certificate(
             common_name=cert_in.common_name,
             subject_dn=cert_in.subject_dn,
             certificate_type=cert_in.certificate_type,
+            key_algorithm=cert_in.key_algorithm,
             key_size=cert_in.key_size,
             valid_days=cert_in.valid_days,
             include_private_key=cert_in.include_private_key,
@@ -176,17 +177,23 @@ async def sign_csr(
 @router.get("/", response_model=list[CertificateResponse])
 async def read_certificates(
     ca_id: int | None = Query(None, description="Filter by CA ID"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_session),  # noqa: B008
     current_user: User = Depends(get_current_active_user),  # noqa: B008
 ) -> list[CertificateResponse]:
     """Get all certificates, optionally filtered by CA ID."""
     cert_service = CertificateService(db)
     if current_user.role == UserRole.SUPERUSER:
-        certs = await cert_service.list_certificates(ca_id=ca_id)
+        certs = await cert_service.list_certificates(
+            ca_id=ca_id, skip=skip, limit=limit
+        )
     else:
         certs = await cert_service.list_certificates(
             ca_id=ca_id,
             organization_id=current_user.organization_id,
+            skip=skip,
+            limit=limit,
         )
     return certs
 
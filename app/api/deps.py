@@ -1,60 +1,104 @@
+import hashlib
+import re
+import time
+from typing import Any
 from zoneinfo import ZoneInfo
 
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jwt.exceptions import InvalidTokenError
+from jwt.exceptions import DecodeError, InvalidTokenError
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
-from app.db.models import User, UserRole
+from app.core.cache import TTLCache
+from app.core.config import JWT_ALGORITHM, JWT_KEY, settings
+from app.db.models import PRIVILEGED_ROLES, User, UserRole
 from app.db.session import get_session
 from app.schemas.user import TokenPayload
 
 UTC = ZoneInfo("UTC")
 
+_CREDENTIALS_ERROR = "Could not validate credentials"
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+_INACTIVE_USER = "Inactive user"
+_INSUFFICIENT_PRIVILEGES = "The user doesn't have sufficient privileges"
+_MALFORMED_TOKEN = "Malformed token"
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/token")
 
+# Only the algorithm tokens are signed with is accepted on verification
+_JWT_ALGORITHMS = [JWT_ALGORITHM]
 
-async def _validate_token(db: AsyncSession, token: str) -> tuple[User, TokenPayload]:
-    """Decode and validate an access token, returning user and payload."""
-    credentials_exception = HTTPException(
+# Three non-empty base64url segments; anything else cannot be a signed JWT.
+_JWT_SHAPE = re.compile(r"[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+")
+_MAX_TOKEN_LENGTH = 8192
+
+# Successfully decoded token payloads, keyed by a digest of the raw token.
+# Entries never outlive the token's own ``exp`` claim.
+_token_cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=4096, ttl=30)
+
+
+def _looks_like_jwt(token: str) -> bool:
+    """Cheap structural check so junk tokens skip hashing and verification."""
+    return len(token) <= _MAX_TOKEN_LENGTH and _JWT_SHAPE.fullmatch(token) is not None
+
+
+def _decode_token(token: str) -> dict[str, Any]:
+    """Decode and verify a JWT, reusing recent successful decodes."""
+    if not _looks_like_jwt(token):
+        raise DecodeError(_MALFORMED_TOKEN)
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+    payload = _token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(token, JWT_KEY, algorithms=_JWT_ALGORITHMS)
+    exp = payload.get("exp")
+    ttl = exp - time.time() if isinstance(exp, int | float) else None
+    _token_cache.set(key, payload, ttl=ttl)
+    return payload
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
+        detail=_CREDENTIALS_ERROR,
+        headers=_BEARER_CHALLENGE,
     )
+
+
+async def _validate_token(db: AsyncSession, token: str) -> tuple[User, TokenPayload]:
+    """Decode and validate an access token, returning user and payload."""
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
+        payload = _decode_token(token)
+        token_data = TokenPayload.model_validate(payload)
     except (InvalidTokenError, ValidationError) as err:
-        raise credentials_exception from err
+        raise _credentials_exception() from err
 
     if token_data.jti:
         from app.services.token import TokenService
 
         token_service = TokenService(db)
         if await token_service.is_token_blocklisted(token_data.jti):
-            raise credentials_exception
+            raise _credentials_exception()
 
     from app.services.user import UserService
 
     user_service = UserService(db)
-    user = await user_service.get_user_by_id(token_data.id)
+    user = await user_service.get_cached_user_by_id(token_data.id)
 
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     if user.tokens_invalidated_at:
         if token_data.iat is None:
-            raise credentials_exception
+            raise _credentials_exception()
         invalidated_at = user.tokens_invalidated_at
         if invalidated_at.tzinfo is None:
             invalidated_at = invalidated_at.replace(tzinfo=UTC)
         if token_data.iat < invalidated_at.timestamp():
-            raise credentials_exception
+            raise _credentials_exception()
 
     return user, token_data
 
@@ -81,7 +125,7 @@ async def get_current_active_user(
 ) -> User:
     """Get current active user."""
     if not current_user.is_active:
-        raise HTTPException(status_code=400, detail="Inactive user")
+        raise HTTPException(status_code=400, detail=_INACTIVE_USER)
     return current_user
 
 
@@ -92,7 +136,7 @@ async def get_current_active_superuser(
     if current_user.role != UserRole.SUPERUSER:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="The user doesn't have sufficient privileges",
+            detail=_INSUFFICIENT_PRIVILEGES,
         )
     return current_user
 
@@ -101,9 +145,9 @@ async def get_current_active_admin_user(
     current_user: User = Depends(get_current_active_user),  # noqa: B008
 ) -> User:
     """Get current active user with admin privileges (ADMIN or SUPERUSER)."""
-    if current_user.role not in [UserRole.ADMIN, UserRole.SUPERUSER]:
+    if current_user.role not in PRIVILEGED_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="The user doesn't have sufficient privileges",
+            detail=_INSUFFICIENT_PRIVILEGES,
         )
     return current_user
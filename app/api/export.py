@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user
 from app.db.models import AuditAction, PermissionAction, User
 from app.db.session import get_session
 from app.services.audit import AuditService
-from app.services.ca import CAService
 from app.services.cert import CertificateService
 from app.services.encryption import EncryptionService
 from app.services.exceptions import NotFoundError, PermissionDeniedError
@@ -14,9 +15,33 @@ from app.services.permission import PermissionService
 router = APIRouter()
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return bool(tags & {"*", etag.removeprefix("W/")})
+
+
+def _cacheable_pem_response(request: Request, pem: str, filename: str) -> Response:
+    """Return a public PEM with an ETag, or 304 if the client already has it."""
+    # Weak: GZipMiddleware may compress the body, so the tag names the PEM
+    # content rather than one exact byte representation of it
+    etag = f'W/"{hashlib.sha256(pem.encode("utf-8")).hexdigest()[:16]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=pem,
+        media_type="application/x-pem-file",
+        headers={**headers, "Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
 @router.get("/ca/{ca_id}/certificate")
 async def export_ca_certificate(
     ca_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_session),  # noqa: B008
     current_user: User = Depends(get_current_active_user),  # noqa: B008
 ) -> Response:
@@ -29,12 +54,8 @@ async def export_ca_certificate(
     except PermissionDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
 
-    return Response(
-        content=ca.certificate,
-        media_type="application/x-pem-file",
-        headers={
-            "Content-Disposition": (f"attachment; filename=ca_{ca_id}_certificate.pem")
-        },
+    return _cacheable_pem_response(
+        request, ca.certificate, f"ca_{ca_id}_certificate.pem"
     )
 
 
@@ -77,6 +98,7 @@ async def export_ca_private_key(
 @router.get("/certificate/{cert_id}")
 async def export_certificate(
     cert_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_session),  # noqa: B008
     current_user: User = Depends(get_current_active_user),  # noqa: B008
 ) -> Response:
@@ -91,12 +113,8 @@ async def export_certificate(
     except PermissionDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
 
-    return Response(
-        content=cert.certificate,
-        media_type="application/x-pem-file",
-        headers={
-            "Content-Disposition": (f"attachment; filename=certificate_{cert_id}.pem")
-        },
+    return _cacheable_pem_response(
+        request, cert.certificate, f"certificate_{cert_id}.pem"
     )
 
 
@@ -162,31 +180,10 @@ async def export_certificate_chain(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
 
     cert_service = CertificateService(db)
-    ca_service = CAService(db)
-
-    # Get the certificate chain
-    chain = []
-    chain.append(cert.certificate)
-
-    # Add issuer certificates, walking up the CA hierarchy
-    current_issuer_id = cert.issuer_id
-    while current_issuer_id is not None:
-        issuer = await ca_service.get_ca(current_issuer_id)
-        if not issuer:
-            issuer_cert = await cert_service.get_certificate(current_issuer_id)
-            if issuer_cert:
-                chain.append(issuer_cert.certificate)
-                current_issuer_id = issuer_cert.issuer_id
-            else:
-                break
-        else:
-            chain.append(issuer.certificate)
-            current_issuer_id = issuer.parent_ca_id
-
-    chain_pem = "\n".join(chain)
+    chain = await cert_service.get_certificate_chain(cert)
 
     return Response(
-        content=chain_pem,
+        content="\n".join(chain),
         media_type="application/x-pem-file",
         headers={
             "Content-Disposition": (
@@ -79,24 +79,11 @@ async def read_organization(
     """
     organization_service = OrganizationService(db)
 
-    # Superusers can access any organization
-    if current_user.role == UserRole.SUPERUSER:
-        organization = await organization_service.get_organization_by_id(
-            organization_id
-        )
-        if not organization:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Organization not found",
-            )
-        return organization
-
-    # Check if user has access to the organization
-    has_access = await organization_service.user_has_organization_access(
-        current_user.id, organization_id
-    )
-
-    if not has_access:
+    # Superusers can access any organization; everyone else only their own
+    if (
+        current_user.role != UserRole.SUPERUSER
+        and current_user.organization_id != organization_id
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to access this organization",
@@ -371,11 +358,7 @@ async def remove_user_from_organization(
         return user
 
     # For admin users, check access
-    has_access = await organization_service.user_has_organization_access(
-        current_user.id, organization_id
-    )
-
-    if not has_access:
+    if current_user.organization_id != organization_id:
         logger.debug(
             "User %s does not have access to org %s", current_user.id, organization_id
         )
@@ -429,31 +412,18 @@ async def read_organization_users(
 
     organization_service = OrganizationService(db)
 
-    # Check if organization exists
-    org = await organization_service.get_organization_by_id(organization_id)
-    if not org:
-        logger.debug("Organization %s not found", organization_id)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Organization not found",
-        )
-
-    # Superusers can see users in any organization
-    if current_user.role == UserRole.SUPERUSER:
-        logger.debug(
-            "User %s is superuser, getting all users for org %s",
-            current_user.id,
-            organization_id,
-        )
-        users = await organization_service.get_organization_users(organization_id)
-        return users
-
-    # Check if user has access to the organization
-    has_access = await organization_service.user_has_organization_access(
-        current_user.id, organization_id
-    )
-
-    if not has_access:
+    # Superusers can see users in any organization; everyone else only their
+    # own. Check before loading members so a refused caller never pulls them.
+    if (
+        current_user.role != UserRole.SUPERUSER
+        and current_user.organization_id != organization_id
+    ):
+        if not await organization_service.get_organization_by_id(organization_id):
+            logger.debug("Organization %s not found", organization_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Organization not found",
+            )
         logger.debug(
             "User %s does not have access to org %s", current_user.id, organization_id
         )
@@ -462,8 +432,13 @@ async def read_organization_users(
             detail="You don't have permission to access this organization",
         )
 
-    logger.debug(
-        "User %s has access, getting users for org %s", current_user.id, organization_id
-    )
-    users = await organization_service.get_organization_users(organization_id)
-    return users
+    # Load the organization and its members in a single round trip
+    org = await organization_service.get_organization_with_users(organization_id)
+    if not org:
+        logger.debug("Organization %s not found", organization_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organization not found",
+        )
+
+    return org.users
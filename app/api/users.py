@@ -1,13 +1,17 @@
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.api.deps import get_current_active_superuser, get_current_active_user
+from app.api.deps import (
+    get_current_active_superuser,
+    get_current_active_user,
+    get_current_user,
+)
 from app.core.config import logger, settings
-from app.db.models import AuditAction, User, UserRole
+from app.db.models import PRIVILEGED_ROLES, AuditAction, User, UserRole
 from app.db.session import get_session
 from app.schemas.user import User as UserSchema
 from app.schemas.user import UserCreate, UserUpdate
@@ -31,18 +35,18 @@ async def create_user(
     logger.debug("Create user request for username: %s", user_in.username)
     user_service = UserService(db)
 
-    # Check if username already exists
-    db_user = await user_service.get_user_by_username(username=user_in.username)
-    if db_user:
+    # Check username/email uniqueness and whether any user exists in one query
+    username_taken, email_taken, any_user = await user_service.get_registration_state(
+        username=user_in.username, email=user_in.email
+    )
+    if username_taken:
         logger.info("Create user failed: username already exists: %s", user_in.username)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered",
         )
 
-    # Check if email already exists
-    db_user = await user_service.get_user_by_email(email=user_in.email)
-    if db_user:
+    if email_taken:
         logger.info("Create user failed: email already exists: %s", user_in.email)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -53,8 +57,6 @@ async def create_user(
     current_user = None
     if token:
         try:
-            from app.api.deps import get_current_user
-
             current_user = await get_current_user(token=token, db=db)
             logger.debug(
                 "Token provided by user: %s (role: %s)",
@@ -66,16 +68,14 @@ async def create_user(
             # Invalid token, current_user remains None
             pass
 
-    # Check if there are any users in the system
-    result = await db.execute(select(User).limit(1))
-    first_user = result.scalar_one_or_none() is None
+    first_user = not any_user
 
     logger.debug("First user check: %s", first_user)
 
     # If not the first user and not authenticated, check registration policy
     if not first_user and current_user is None:
         # Elevated roles always require authentication
-        if user_in.role in [UserRole.ADMIN, UserRole.SUPERUSER]:
+        if user_in.role in PRIVILEGED_ROLES:
             logger.info(
                 "Create user failed: insufficient permissions to create %s user",
                 user_in.role,
@@ -95,7 +95,7 @@ async def create_user(
     # Only superusers can create users with admin/superuser roles
     # But for the first user in the system, we allow any role
     if (
-        user_in.role in [UserRole.ADMIN, UserRole.SUPERUSER]
+        user_in.role in PRIVILEGED_ROLES
         and not first_user
         and (current_user is None or current_user.role != UserRole.SUPERUSER)
     ):
@@ -139,15 +139,15 @@ async def create_user(
 
 @router.get("/", response_model=list[UserSchema])
 async def read_users(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_session),  # noqa: B008
     current_user: User = Depends(get_current_active_superuser),  # noqa: B008
 ) -> Any:
     """
     Retrieve users. Only superusers can access this endpoint.
     """
-    result = await db.execute(select(User).offset(skip).limit(limit))
+    result = await db.execute(select(User).order_by(User.id).offset(skip).limit(limit))
     users = result.scalars().all()
     return users
 
@@ -181,10 +181,7 @@ async def read_user_by_id(
         )
 
     # Regular users can only see their own profile
-    if (
-        current_user.role not in [UserRole.ADMIN, UserRole.SUPERUSER]
-        and current_user.id != user_id
-    ):
+    if current_user.role not in PRIVILEGED_ROLES and current_user.id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
@@ -1,5 +1,5 @@
 import logging
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -23,28 +23,39 @@ class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: str | None = "sqlite+aiosqlite:///./fastpki.db"
     DATABASE_CONNECT_ARGS: dict[str, Any] = {}
+    # Connection pool sizing (ignored for SQLite)
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_POOL_RECYCLE: int = 1800  # seconds
+    # asyncpg prepared-statement caches; disabled when DATABASE_PGBOUNCER is set
+    DATABASE_STATEMENT_CACHE_SIZE: int = 500
+    DATABASE_PGBOUNCER: bool = False
 
     @field_validator("DATABASE_URL")
     def validate_database_url(cls, v: str | None) -> Any:  # noqa: N805
-        if v and v.startswith("sqlite"):
-            if not v.startswith("sqlite+aiosqlite"):
-                return v.replace("sqlite", "sqlite+aiosqlite")
-            return v
-        if v and v.startswith("postgresql"):
-            return v.replace("postgresql", "postgresql+asyncpg")
+        # Only rewrite a bare scheme; URLs that already name a driver pass through
+        if v and v.startswith("sqlite:"):
+            return "sqlite+aiosqlite:" + v.removeprefix("sqlite:")
+        if v and v.startswith("postgresql:"):
+            return "postgresql+asyncpg:" + v.removeprefix("postgresql:")
         return v
 
     # CA settings
     CA_KEY_SIZE: int = 4096
     CA_CERT_DAYS: int = 3650  # 10 years
-    CERT_KEY_SIZE: int = 2048
+    CERT_KEY_SIZE: int = 2048  # RSA only
+    CERT_KEY_ALGORITHM: Literal["rsa", "ecdsa_p256", "ed25519"] = "rsa"
     CERT_DAYS: int = 365  # 1 year
+    # Pre-generated CERT_KEY_SIZE key pairs kept per worker; 0 disables the pool
+    KEY_POOL_SIZE: int = 4
 
     # Security settings
     SECRET_KEY: str = "supersecretkey"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15  # 15 minutes
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
     ALGORITHM: str = "HS256"
+    USER_CACHE_TTL_SECONDS: int = 0  # opt-in; per-process, so changes lag on others
+    BCRYPT_ROUNDS: int = 12  # work factor for new password hashes
 
     # Rate limiting
     AUTH_RATE_LIMIT: str = "5/minute"
@@ -63,6 +74,13 @@ class Settings(BaseSettings):
             raise ValueError("SECRET_KEY must be at least 32 characters long")  # noqa: TRY003
         return v
 
+    @field_validator("BCRYPT_ROUNDS")
+    def validate_bcrypt_rounds(cls, v: int) -> int:  # noqa: N805
+        # bcrypt.gensalt only accepts this range; fail at startup, not at login
+        if not 4 <= v <= 31:
+            raise ValueError("BCRYPT_ROUNDS must be between 4 and 31")  # noqa: TRY003
+        return v
+
     # Private key encryption
     PRIVATE_KEY_ENCRYPTION_KEY: str | None = None
 
@@ -107,6 +125,11 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
+# JWT signing key and algorithm, bound once at startup. Token encoding and
+# decoding both use these, so the two sides cannot drift apart.
+JWT_KEY = settings.SECRET_KEY
+JWT_ALGORITHM = settings.ALGORITHM
+
 # Update logging level based on settings
 log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
 logger.setLevel(log_level)
@@ -4,17 +4,27 @@ from typing import Optional
 from zoneinfo import ZoneInfo
 
 from sqlalchemy import Column, DateTime
+from sqlalchemy import Enum as SAEnum
 from sqlmodel import Field, Relationship, SQLModel
 
 UTC = ZoneInfo("UTC")
 
 
+def _utcnow() -> datetime:
+    """Column default for timezone-aware timestamps."""
+    return datetime.now(UTC)
+
+
 class UserRole(str, Enum):
     SUPERUSER = "superuser"
     ADMIN = "admin"
     USER = "user"
 
 
+# Roles allowed to administer users and organizations
+PRIVILEGED_ROLES: frozenset[UserRole] = frozenset({UserRole.ADMIN, UserRole.SUPERUSER})
+
+
 class PermissionAction(str, Enum):
     READ = "read"
     CREATE_CA = "create_ca"
@@ -37,6 +47,12 @@ class CertificateType(str, Enum):
     DUAL_PURPOSE = "dual_purpose"
 
 
+class KeyAlgorithm(str, Enum):
+    RSA = "rsa"
+    ECDSA_P256 = "ecdsa_p256"
+    ED25519 = "ed25519"
+
+
 class AuditAction(str, Enum):
     CA_CREATE = "ca_create"
     CA_DELETE = "ca_delete"
@@ -64,15 +80,15 @@ class Organization(SQLModel, table=True):
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
+            default=_utcnow,
         )
     )
     updated_at: datetime = Field(
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
-            onupdate=lambda: datetime.now(UTC),
+            default=_utcnow,
+            onupdate=_utcnow,
         )
     )
 
@@ -95,26 +111,28 @@ class CertificateAuthority(CertificateAuthorityBase, table=True):
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
+            default=_utcnow,
         )
     )
     updated_at: datetime = Field(
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
-            onupdate=lambda: datetime.now(UTC),
+            default=_utcnow,
+            onupdate=_utcnow,
         )
     )
 
     private_key: str  # PEM encoded
     certificate: str  # PEM encoded
 
-    organization_id: int | None = Field(default=None, foreign_key="organizations.id")
+    organization_id: int | None = Field(
+        default=None, foreign_key="organizations.id", index=True
+    )
     created_by_user_id: int | None = Field(default=None, foreign_key="users.id")
 
     parent_ca_id: int | None = Field(
-        default=None, foreign_key="certificate_authorities.id"
+        default=None, foreign_key="certificate_authorities.id", index=True
     )
     path_length: int | None = Field(default=None)
     allow_leaf_certs: bool = Field(default=True)
@@ -138,6 +156,12 @@ class CertificateBase(SQLModel):
     common_name: str = Field(index=True)
     subject_dn: str
     certificate_type: CertificateType
+    # None for CSR keys KeyAlgorithm cannot name (other EC curves, Ed448, DSA).
+    # No column default: the ORM would otherwise write RSA in place of None.
+    key_algorithm: KeyAlgorithm | None = Field(
+        default=KeyAlgorithm.RSA,
+        sa_column=Column(SAEnum(KeyAlgorithm), nullable=True),
+    )
     key_size: int
     valid_days: int
     status: CertificateStatus = Field(default=CertificateStatus.VALID)
@@ -151,15 +175,15 @@ class Certificate(CertificateBase, table=True):
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
+            default=_utcnow,
         )
     )
     updated_at: datetime = Field(
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
-            onupdate=lambda: datetime.now(UTC),
+            default=_utcnow,
+            onupdate=_utcnow,
         )
     )
 
@@ -177,11 +201,13 @@ class Certificate(CertificateBase, table=True):
     )
 
     issuer_id: int | None = Field(
-        default=None, foreign_key="certificate_authorities.id"
+        default=None, foreign_key="certificate_authorities.id", index=True
     )
     issuer: CertificateAuthority | None = Relationship(back_populates="certificates")
 
-    organization_id: int | None = Field(default=None, foreign_key="organizations.id")
+    organization_id: int | None = Field(
+        default=None, foreign_key="organizations.id", index=True
+    )
     created_by_user_id: int | None = Field(default=None, foreign_key="users.id")
 
 
@@ -193,7 +219,7 @@ class CRLEntry(SQLModel, table=True):
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
+            default=_utcnow,
         )
     )
 
@@ -203,7 +229,7 @@ class CRLEntry(SQLModel, table=True):
     )
     reason: str | None = None
 
-    ca_id: int = Field(foreign_key="certificate_authorities.id")
+    ca_id: int = Field(foreign_key="certificate_authorities.id", index=True)
 
 
 class User(SQLModel, table=True):
@@ -219,15 +245,15 @@ class User(SQLModel, table=True):
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
+            default=_utcnow,
         )
     )
     updated_at: datetime = Field(
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
-            onupdate=lambda: datetime.now(UTC),
+            default=_utcnow,
+            onupdate=_utcnow,
         )
     )
 
@@ -242,7 +268,9 @@ class User(SQLModel, table=True):
         sa_column=Column(DateTime(timezone=True), nullable=True),
     )
 
-    organization_id: int | None = Field(default=None, foreign_key="organizations.id")
+    organization_id: int | None = Field(
+        default=None, foreign_key="organizations.id", index=True
+    )
     organization: Organization | None = Relationship(back_populates="users")
 
 
@@ -256,7 +284,7 @@ class BlocklistedToken(SQLModel, table=True):
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
+            default=_utcnow,
         )
     )
 
@@ -275,7 +303,7 @@ class RefreshToken(SQLModel, table=True):
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
+            default=_utcnow,
         )
     )
 
@@ -288,7 +316,7 @@ class AuditLog(SQLModel, table=True):
         sa_column=Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(UTC),
+            default=_utcnow,
             index=True,
         )
     )
@@ -1,4 +1,5 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
@@ -6,14 +7,36 @@ from sqlmodel import SQLModel
 from app.core.config import settings
 
 connect_args = settings.DATABASE_CONNECT_ARGS
+pool_args: dict[str, Any] = {}
 if settings.DATABASE_URL and settings.DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False, **connect_args}
+else:
+    pool_args = {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        # Reuse the most recently returned connection so surplus ones go idle
+        "pool_use_lifo": True,
+    }
+    if settings.DATABASE_URL and settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+        # PgBouncer in transaction mode cannot keep prepared statements across
+        # transactions, so both the SQLAlchemy and asyncpg caches are turned off
+        cache_size = (
+            0 if settings.DATABASE_PGBOUNCER else settings.DATABASE_STATEMENT_CACHE_SIZE
+        )
+        connect_args = {
+            "prepared_statement_cache_size": cache_size,
+            "statement_cache_size": cache_size,
+            **connect_args,
+        }
 
 engine = create_async_engine(
     str(settings.DATABASE_URL),  # Cast to string for type safety
     echo=False,
     future=True,
+    pool_pre_ping=True,
     connect_args=connect_args,
+    **pool_args,
 )
 
 
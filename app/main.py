@@ -5,6 +5,8 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
@@ -18,6 +20,7 @@ from app.api.pki import ca_router, crl_router
 from app.core.config import logger, settings
 from app.db.session import create_db_and_tables
 from app.services.encryption import encrypt_existing_keys
+from app.services.key_pool import key_pool
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -30,7 +33,8 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         response.headers["X-Content-Type-Options"] = "nosniff"
         response.headers["X-Frame-Options"] = "DENY"
         response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Cache-Control"] = "no-store"
+        # Endpoints serving public, immutable content may opt into caching
+        response.headers.setdefault("Cache-Control", "no-store")
         response.headers["Strict-Transport-Security"] = (
             "max-age=63072000; includeSubDomains"
         )
@@ -61,9 +65,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     await create_db_and_tables()
     await encrypt_existing_keys()
     gc_task = asyncio.create_task(token_gc_loop())
+    key_pool.start()
     try:
         yield
     finally:
+        await key_pool.stop()
         gc_task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await gc_task
@@ -73,18 +79,27 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Innermost middleware: the BaseHTTPMiddleware-based ones re-stream response
+# bodies, which would defeat GZip's minimum-size check if it ran outside them
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
 app.add_middleware(SlowAPIMiddleware)
 
 # Set all CORS enabled origins
 if settings.BACKEND_CORS_ORIGINS:
+    # Browsers reject credentialed responses for a wildcard origin, and Starlette
+    # would otherwise echo back every Origin; the API authenticates with bearer
+    # tokens, so a wildcard only needs plain CORS.
+    allow_all_origins = "*" in settings.BACKEND_CORS_ORIGINS
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
-        allow_credentials=True,
+        allow_origins=["*"] if allow_all_origins else settings.BACKEND_CORS_ORIGINS,
+        allow_credentials=not allow_all_origins,
         allow_methods=["*"],
         allow_headers=["*"],
     )
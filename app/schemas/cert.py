@@ -2,13 +2,14 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
-from app.db.models import CertificateStatus, CertificateType
+from app.db.models import CertificateStatus, CertificateType, KeyAlgorithm
 
 
 class CertificateCreate(BaseModel):
     common_name: str
     subject_dn: str
     certificate_type: CertificateType
+    key_algorithm: KeyAlgorithm | None = None
     key_size: int | None = None
     valid_days: int | None = None
     include_private_key: bool = True
@@ -37,6 +38,7 @@ class CertificateResponse(BaseModel):
     common_name: str
     subject_dn: str
     certificate_type: CertificateType
+    key_algorithm: KeyAlgorithm | None
     key_size: int
     valid_days: int
     status: CertificateStatus
@@ -1,9 +1,12 @@
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, EmailStr, StringConstraints
 
 from app.db.models import UserRole
 
+Password = Annotated[str, StringConstraints(min_length=8)]
+
 
 class UserBase(BaseModel):
     username: str
@@ -19,19 +22,12 @@ class UserBase(BaseModel):
 
 
 class UserCreate(UserBase):
-    password: str
-
-    @field_validator("password")
-    @classmethod
-    def password_min_length(cls, v: str) -> str:
-        if len(v) < 8:
-            raise ValueError("Min 8 chars")  # noqa: TRY003
-        return v
+    password: Password
 
 
 class UserUpdate(BaseModel):
     email: EmailStr | None = None
-    password: str | None = None
+    password: Password | None = None
     role: UserRole | None = None
     is_active: bool | None = None
     organization_id: int | None = None
@@ -41,13 +37,6 @@ class UserUpdate(BaseModel):
     can_export_private_key: bool | None = None
     can_delete_ca: bool | None = None
 
-    @field_validator("password")
-    @classmethod
-    def password_min_length(cls, v: str | None) -> str | None:
-        if v is not None and len(v) < 8:
-            raise ValueError("Min 8 chars")  # noqa: TRY003
-        return v
-
 
 class UserInDBBase(UserBase):
     id: int
@@ -7,6 +7,8 @@ from app.db.models import AuditAction, AuditLog
 
 
 class AuditService:
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
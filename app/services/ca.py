@@ -1,23 +1,43 @@
+import asyncio
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import cast
 from zoneinfo import ZoneInfo
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
 from cryptography.x509.oid import NameOID
+from sqlalchemy import literal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlalchemy.orm import aliased, defer
+from sqlmodel import col, select
 
 from app.core.config import settings
-from app.db.models import CertificateAuthority, CRLEntry
+from app.db.models import CertificateAuthority, CRLEntry, KeyAlgorithm
 from app.services.encryption import EncryptionService
 from app.services.exceptions import HasDependentsError
 
 UTC = ZoneInfo("UTC")
 
 
+def _pkcs8_pem(
+    private_key: rsa.RSAPrivateKeyWithSerialization
+    | ec.EllipticCurvePrivateKeyWithSerialization
+    | ed25519.Ed25519PrivateKey,
+) -> bytes:
+    """Serialize a private key as unencrypted PKCS#8 PEM."""
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
 class CAService:
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -29,17 +49,40 @@ class CAService:
             key_size=key_size,
         )
 
-        private_key_pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption(),
-        )
+        return private_key, _pkcs8_pem(private_key)
 
-        return private_key, private_key_pem
+    @staticmethod
+    def generate_private_key(
+        key_algorithm: KeyAlgorithm, key_size: int = 2048
+    ) -> tuple[
+        rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey,
+        bytes,
+    ]:
+        """Generate a key pair of any supported algorithm.
+
+        ``key_size`` only applies to RSA; ECDSA uses P-256 and Ed25519 is fixed.
+        """
+        if key_algorithm == KeyAlgorithm.RSA:
+            return CAService.generate_key_pair(key_size)
+
+        if key_algorithm == KeyAlgorithm.ECDSA_P256:
+            # The cryptography stubs only declare private_bytes on this alias
+            ec_key = cast(
+                ec.EllipticCurvePrivateKeyWithSerialization,
+                ec.generate_private_key(ec.SECP256R1()),
+            )
+            return ec_key, _pkcs8_pem(ec_key)
+
+        ed_key = ed25519.Ed25519PrivateKey.generate()
+        return ed_key, _pkcs8_pem(ed_key)
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def parse_subject_dn(subject_dn: str) -> x509.Name:
-        """Parse a subject DN string into a cryptography Name object."""
+        """Parse a subject DN string into a cryptography Name object.
+
+        Memoized; ``x509.Name`` is immutable, so callers can share the result.
+        """
         parts = {}
         for part in re.split(r"(?<!\\),", subject_dn):
             key, value = part.strip().split("=", 1)
@@ -89,8 +132,10 @@ class CAService:
         key_size = key_size or settings.CA_KEY_SIZE
         valid_days = valid_days or settings.CA_CERT_DAYS
 
-        # Generate key pair
-        private_key, private_key_pem = CAService.generate_key_pair(key_size)
+        # Generate key pair off the event loop
+        private_key, private_key_pem = await asyncio.to_thread(
+            CAService.generate_key_pair, key_size
+        )
 
         # Parse subject DN
         subject = CAService.parse_subject_dn(subject_dn)
@@ -261,6 +306,8 @@ class CAService:
             path_length=effective_path_length,
             allow_leaf_certs=effective_allow_leaf_certs,
             crl_base_url=crl_base_url,
+            created_at=now,
+            updated_at=now,
         )
 
         self.db.add(ca)
@@ -290,12 +337,21 @@ class CAService:
         return result.scalar_one_or_none()
 
     async def list_cas(
-        self, organization_id: int | None = None
+        self,
+        organization_id: int | None = None,
+        skip: int = 0,
+        limit: int = 100,
     ) -> list[CertificateAuthority]:
-        """List Certificate Authorities, optionally filtered by organization."""
-        query = select(CertificateAuthority)
+        """List Certificate Authorities, optionally filtered by organization.
+
+        The private key column is not loaded; list responses never include it.
+        """
+        query = select(CertificateAuthority).options(
+            defer(CertificateAuthority.private_key, raiseload=True)  # type: ignore[arg-type]
+        )
         if organization_id is not None:
             query = query.where(CertificateAuthority.organization_id == organization_id)
+        query = query.order_by(CertificateAuthority.id).offset(skip).limit(limit)  # type: ignore[arg-type]
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
@@ -323,16 +379,32 @@ class CAService:
         """Get the CA chain from the given CA up to the root.
 
         Returns an ordered list starting with the given CA and ending at the root.
+        The parent links are followed in a single recursive query.
         """
-        chain: list[CertificateAuthority] = []
-        current_id: int | None = ca_id
-        while current_id is not None:
-            ca = await self.db.get(CertificateAuthority, current_id)
-            if not ca:
-                break
-            chain.append(ca)
-            current_id = ca.parent_ca_id
-        return chain
+        ancestors = (
+            select(
+                col(CertificateAuthority.id).label("id"),
+                col(CertificateAuthority.parent_ca_id).label("parent_ca_id"),
+                literal(0).label("depth"),
+            )
+            .where(CertificateAuthority.id == ca_id)
+            .cte("ancestors", recursive=True)
+        )
+        parent = aliased(CertificateAuthority)
+        ancestors = ancestors.union_all(
+            select(
+                col(parent.id),
+                col(parent.parent_ca_id),
+                ancestors.c.depth + 1,
+            ).join(ancestors, col(parent.id) == ancestors.c.parent_ca_id)
+        )
+        query = (
+            select(CertificateAuthority)
+            .join(ancestors, col(CertificateAuthority.id) == ancestors.c.id)
+            .order_by(ancestors.c.depth)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
 
     async def get_child_cas(self, ca_id: int) -> list[CertificateAuthority]:
         """Get direct child CAs of the given CA."""
@@ -1,19 +1,32 @@
 import ipaddress
 import re
 from datetime import datetime, timedelta
+from typing import cast
 from zoneinfo import ZoneInfo
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric.dsa import DSAPublicKey
-from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePublicKey
-from cryptography.hazmat.primitives.asymmetric.ed448 import Ed448PublicKey
-from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+from cryptography.hazmat.primitives.asymmetric.dsa import DSAPrivateKey, DSAPublicKey
+from cryptography.hazmat.primitives.asymmetric.ec import (
+    SECP256R1,
+    EllipticCurvePrivateKey,
+    EllipticCurvePublicKey,
+)
+from cryptography.hazmat.primitives.asymmetric.ed448 import (
+    Ed448PrivateKey,
+    Ed448PublicKey,
+)
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
 from cryptography.x509.oid import ExtendedKeyUsageOID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from sqlmodel import select
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.db.models import (
     Certificate,
@@ -21,10 +34,12 @@ from app.db.models import (
     CertificateStatus,
     CertificateType,
     CRLEntry,
+    KeyAlgorithm,
 )
 from app.services.ca import CAService
 from app.services.encryption import EncryptionService
 from app.services.exceptions import LeafCertNotAllowedError
+from app.services.key_pool import key_pool
 
 UTC = ZoneInfo("UTC")
 
@@ -36,8 +51,49 @@ CertPublicKey = (
     | RSAPublicKey
 )
 
+CAPrivateKey = (
+    DSAPrivateKey
+    | Ed25519PrivateKey
+    | Ed448PrivateKey
+    | EllipticCurvePrivateKey
+    | RSAPrivateKey
+)
+CAMaterial = tuple[CAPrivateKey, x509.Certificate, x509.SubjectKeyIdentifier]
+
+# Keyed on CA ID and public certificate, never on private key material
+_ca_material_cache: TTLCache[tuple[int | None, str], CAMaterial] = TTLCache(
+    maxsize=128, ttl=3600
+)
+
+
+def _load_ca_material(ca: CertificateAuthority) -> CAMaterial:
+    """Decrypt and parse a CA's key and certificate, memoized per certificate.
+
+    A re-keyed or renewed CA has a new certificate, so it simply misses the
+    cache instead of being served stale material.
+    """
+    cache_key = (ca.id, ca.certificate)
+    material = _ca_material_cache.get(cache_key)
+    if material is not None:
+        return material
+
+    private_key = cast(
+        CAPrivateKey,
+        serialization.load_pem_private_key(
+            EncryptionService.decrypt_private_key(ca.private_key).encode("utf-8"),
+            password=None,
+        ),
+    )
+    cert = x509.load_pem_x509_certificate(ca.certificate.encode("utf-8"))
+    ski = cert.extensions.get_extension_for_class(x509.SubjectKeyIdentifier).value
+    material = (private_key, cert, ski)
+    _ca_material_cache.set(cache_key, material)
+    return material
+
 
 class CertificateService:
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -57,8 +113,10 @@ class CertificateService:
         san_ip_addresses: list[str] | None = None,
         san_email_addresses: list[str] | None = None,
         public_key: CertPublicKey | None = None,
+        key_algorithm: KeyAlgorithm | None = None,
     ) -> Certificate:
         """Create a new certificate signed by the specified CA."""
+        key_algorithm = key_algorithm or KeyAlgorithm(settings.CERT_KEY_ALGORITHM)
         key_size = key_size or settings.CERT_KEY_SIZE
         valid_days = valid_days or settings.CERT_DAYS
 
@@ -73,25 +131,29 @@ class CertificateService:
             )
 
         # Load CA private key and certificate
-        ca_key_pem = EncryptionService.decrypt_private_key(ca.private_key)
-        ca_private_key = serialization.load_pem_private_key(
-            ca_key_pem.encode("utf-8"),
-            password=None,
-        )
-        ca_cert = x509.load_pem_x509_certificate(
-            ca.certificate.encode("utf-8"),
-        )
+        ca_private_key, ca_cert, ca_ski = _load_ca_material(ca)
 
-        # Get public key: from provided key (CSR case) or generate a new pair
+        # Get public key: from provided key (CSR case), an RSA pair from the key
+        # pool (generated off the event loop when it runs dry), or a new EC pair
         private_key_pem = None
+        pub_key: CertPublicKey
         if public_key is not None:
             pub_key = public_key
-        elif include_private_key:
-            private_key_obj, private_key_pem = CAService.generate_key_pair(key_size)
-            pub_key = private_key_obj.public_key()
+            key_algorithm, key_size = self.describe_public_key(public_key)
+        elif key_algorithm == KeyAlgorithm.RSA:
+            rsa_key, generated_pem = await key_pool.get(key_size)
+            pub_key = rsa_key.public_key()
+            if include_private_key:
+                private_key_pem = generated_pem
         else:
-            private_key_obj, _ = CAService.generate_key_pair(key_size)
+            # ECDSA and Ed25519 keys are cheap enough to generate inline
+            private_key_obj, generated_pem = CAService.generate_private_key(
+                key_algorithm
+            )
             pub_key = private_key_obj.public_key()
+            key_size = 256
+            if include_private_key:
+                private_key_pem = generated_pem
 
         # Parse subject DN
         subject = CAService.parse_subject_dn(subject_dn)
@@ -122,7 +184,8 @@ class CertificateService:
         key_usage = x509.KeyUsage(
             digital_signature=True,
             content_commitment=False,
-            key_encipherment=True,
+            # RSA key transport only; EC and EdDSA keys must not assert it
+            key_encipherment=isinstance(pub_key, RSAPublicKey),
             data_encipherment=False,
             key_agreement=False,
             key_cert_sign=(certificate_type == CertificateType.CA),
@@ -210,11 +273,8 @@ class CertificateService:
         )
 
         # Add Authority Key Identifier
-        ca_ski = ca_cert.extensions.get_extension_for_class(x509.SubjectKeyIdentifier)
         cert_builder = cert_builder.add_extension(
-            x509.AuthorityKeyIdentifier.from_issuer_subject_key_identifier(
-                ca_ski.value
-            ),
+            x509.AuthorityKeyIdentifier.from_issuer_subject_key_identifier(ca_ski),
             critical=False,
         )
 
@@ -260,6 +320,7 @@ class CertificateService:
             common_name=common_name,
             subject_dn=subject_dn,
             certificate_type=certificate_type,
+            key_algorithm=key_algorithm,
             key_size=key_size,
             valid_days=valid_days,
             status=CertificateStatus.VALID,
@@ -275,14 +336,38 @@ class CertificateService:
             issuer_id=ca_id,
             organization_id=organization_id,
             created_by_user_id=created_by_user_id,
+            created_at=now,
+            updated_at=now,
         )
 
+        # Every column is set client-side, so the committed object is already
+        # complete; expire_on_commit=False keeps it loaded without a refresh
         self.db.add(cert)
         await self.db.commit()
-        await self.db.refresh(cert)
 
         return cert
 
+    @staticmethod
+    def describe_public_key(
+        public_key: CertPublicKey,
+    ) -> tuple[KeyAlgorithm | None, int]:
+        """Return the algorithm and size in bits of a supplied public key.
+
+        Keys that ``KeyAlgorithm`` cannot name, such as EC curves other than
+        P-256, Ed448 or DSA, are still signed; their algorithm is ``None``.
+        """
+        if isinstance(public_key, RSAPublicKey):
+            return KeyAlgorithm.RSA, public_key.key_size
+        if isinstance(public_key, EllipticCurvePublicKey):
+            if isinstance(public_key.curve, SECP256R1):
+                return KeyAlgorithm.ECDSA_P256, public_key.curve.key_size
+            return None, public_key.curve.key_size
+        if isinstance(public_key, Ed25519PublicKey):
+            return KeyAlgorithm.ED25519, 256
+        if isinstance(public_key, Ed448PublicKey):
+            return None, 448
+        return None, public_key.key_size
+
     @staticmethod
     def parse_csr(csr_pem: str) -> x509.CertificateSigningRequest:
         """Parse and verify a PEM-encoded CSR."""
@@ -390,17 +475,33 @@ class CertificateService:
         cert = await self.db.get(Certificate, cert_id)
         return cert
 
+    async def get_certificate_chain(self, cert: Certificate) -> list[str]:
+        """Return the PEMs of a certificate and its issuers, leaf first."""
+        chain = [cert.certificate]
+        if cert.issuer_id is not None:
+            issuers = await CAService(self.db).get_ca_chain(cert.issuer_id)
+            chain.extend(issuer.certificate for issuer in issuers)
+        return chain
+
     async def list_certificates(
         self,
         ca_id: int | None = None,
         organization_id: int | None = None,
+        skip: int = 0,
+        limit: int = 100,
     ) -> list[Certificate]:
-        """List certificates, optionally filtered by CA ID and/or organization."""
-        query = select(Certificate)
+        """List certificates, optionally filtered by CA ID and/or organization.
+
+        The private key column is not loaded; list responses never include it.
+        """
+        query = select(Certificate).options(
+            defer(Certificate.private_key, raiseload=True)  # type: ignore[arg-type]
+        )
         if ca_id:
             query = query.where(Certificate.issuer_id == ca_id)
         if organization_id is not None:
             query = query.where(Certificate.organization_id == organization_id)
+        query = query.order_by(Certificate.id).offset(skip).limit(limit)  # type: ignore[arg-type]
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
@@ -433,6 +534,5 @@ class CertificateService:
 
         self.db.add(crl_entry)
         await self.db.commit()
-        await self.db.refresh(cert)
 
         return cert
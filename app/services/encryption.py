@@ -109,5 +109,9 @@ async def encrypt_existing_keys() -> None:
                     session.add(cert)
                     count += 1
 
+            # Nothing queries after the certificate loop, so flush it
+            # explicitly; the commit itself stays with engine.begin()
+            await session.commit()
+
     if count > 0:
         logger.info("Encrypted %d existing plaintext private keys", count)
@@ -0,0 +1,67 @@
+import asyncio
+import contextlib
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.core.config import logger, settings
+from app.services.ca import CAService
+
+
+class KeyPool:
+    """Background-filled pool of pre-generated RSA key pairs.
+
+    Keeps up to ``sizes[key_size]`` key pairs ready per key size so issuance
+    does not wait on key generation. Sizes that are not pooled, or a pool that
+    has run dry, fall back to generating a pair on demand.
+    """
+
+    __slots__ = ("_queues", "_sizes", "_tasks")
+
+    def __init__(self, sizes: dict[int, int]):
+        self._sizes = {size: n for size, n in sizes.items() if n > 0}
+        self._queues: dict[int, asyncio.Queue[tuple[rsa.RSAPrivateKey, bytes]]] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        """Start one refill task per pooled key size."""
+        for size, n in self._sizes.items():
+            queue: asyncio.Queue[tuple[rsa.RSAPrivateKey, bytes]] = asyncio.Queue(
+                maxsize=n
+            )
+            self._queues[size] = queue
+            self._tasks.append(asyncio.create_task(self._refill(size, queue)))
+
+    async def stop(self) -> None:
+        """Cancel the refill tasks and drop any pooled keys."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks.clear()
+        self._queues.clear()
+
+    async def get(self, key_size: int) -> tuple[rsa.RSAPrivateKey, bytes]:
+        """Return a key pair of ``key_size`` bits, pooled if one is ready."""
+        queue = self._queues.get(key_size)
+        if queue is not None:
+            with contextlib.suppress(asyncio.QueueEmpty):
+                return queue.get_nowait()
+        return await asyncio.to_thread(CAService.generate_key_pair, key_size)
+
+    @staticmethod
+    async def _refill(
+        key_size: int, queue: asyncio.Queue[tuple[rsa.RSAPrivateKey, bytes]]
+    ) -> None:
+        while True:
+            try:
+                pair = await asyncio.to_thread(CAService.generate_key_pair, key_size)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Key pool: cannot generate %d-bit keys", key_size)
+                return
+            await queue.put(pair)
+
+
+key_pool = KeyPool({settings.CERT_KEY_SIZE: settings.KEY_POOL_SIZE})
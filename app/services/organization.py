@@ -1,7 +1,12 @@
 # mypy: disable-error-code="arg-type"
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import func
+from sqlmodel import col
 
 from app.db.models import Organization, User, UserRole
 from app.services.exceptions import (
@@ -10,6 +15,9 @@ from app.services.exceptions import (
     NotFoundError,
     PermissionDeniedError,
 )
+from app.services.user import invalidate_cached_user
+
+UTC = ZoneInfo("UTC")
 
 _ORG_NOT_FOUND = "Organization not found"
 _ORG_EXISTS = "Organization with this name already exists"
@@ -20,6 +28,8 @@ _HAS_USERS = "Cannot delete organization with users. Remove all users first."
 
 
 class OrganizationService:
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -31,14 +41,16 @@ class OrganizationService:
         if exists:
             raise AlreadyExistsError(_ORG_EXISTS)
 
+        now = datetime.now(UTC)
         org = Organization(
             name=name,
             description=description,
+            created_at=now,
+            updated_at=now,
         )
 
         self.db.add(org)
         await self.db.commit()
-        await self.db.refresh(org)
         return org
 
     async def get_organization_by_id(self, org_id: int) -> Organization | None:
@@ -81,7 +93,6 @@ class OrganizationService:
 
         self.db.add(org)
         await self.db.commit()
-        await self.db.refresh(org)
         return org
 
     async def delete_organization(self, org_id: int) -> bool:
@@ -90,8 +101,7 @@ class OrganizationService:
         if not org:
             raise NotFoundError(_ORG_NOT_FOUND)
 
-        users = await self.get_organization_users(org_id)
-        if users:
+        if await self._organization_has_users(org_id):
             raise HasDependentsError(_HAS_USERS)
 
         await self.db.delete(org)
@@ -106,34 +116,32 @@ class OrganizationService:
         if not org:
             raise NotFoundError(_ORG_NOT_FOUND)
 
-        query = select(User).where(User.id == user_id)
-        result = await self.db.execute(query)
-        user = result.scalar_one_or_none()
+        users = await self._get_users_by_id(user_id, admin_user_id)
+        user = users.get(user_id)
 
         if not user:
             raise NotFoundError(_USER_NOT_FOUND)
 
-        if admin_user_id:
-            can_add = await self.user_can_add_user_to_organization(
-                admin_user_id, org_id, user_id
-            )
-            if not can_add:
-                raise PermissionDeniedError(_NO_ADD_PERM)
+        if admin_user_id and not self._can_add_to_organization(
+            users.get(admin_user_id), org_id
+        ):
+            raise PermissionDeniedError(_NO_ADD_PERM)
 
         user.organization_id = org_id
 
+        # Flushes as a single UPDATE; the user is already loaded and stays
+        # loaded past the commit, so there is nothing to refresh
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
+        invalidate_cached_user(user_id)
         return user
 
     async def remove_user_from_organization(
         self, user_id: int, admin_user_id: int | None = None
     ) -> User:
         """Remove a user from their organization."""
-        query = select(User).where(User.id == user_id)
-        result = await self.db.execute(query)
-        user = result.scalar_one_or_none()
+        users = await self._get_users_by_id(user_id, admin_user_id)
+        user = users.get(user_id)
 
         if not user:
             raise NotFoundError(_USER_NOT_FOUND)
@@ -141,18 +149,18 @@ class OrganizationService:
         if user.organization_id is None:
             return user
 
-        if admin_user_id:
-            can_remove = await self.user_can_remove_user_from_organization(
-                admin_user_id, user_id
-            )
-            if not can_remove:
-                raise PermissionDeniedError(_NO_REMOVE_PERM)
+        if admin_user_id and not self._can_remove_from_organization(
+            users.get(admin_user_id), user
+        ):
+            raise PermissionDeniedError(_NO_REMOVE_PERM)
 
         user.organization_id = None
 
+        # Flushes as a single UPDATE; the user is already loaded and stays
+        # loaded past the commit, so there is nothing to refresh
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
+        invalidate_cached_user(user_id)
         return user
 
     async def get_organization_users(self, org_id: int) -> list[User]:
@@ -161,6 +169,24 @@ class OrganizationService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def get_organization_with_users(self, org_id: int) -> Organization | None:
+        """Get an organization with its users loaded in the same query."""
+        query = (
+            select(Organization)
+            .where(Organization.id == org_id)
+            .options(joinedload(Organization.users))
+        )
+        result = await self.db.execute(query)
+        return result.unique().scalar_one_or_none()
+
+    async def _organization_has_users(self, org_id: int) -> bool:
+        """Check whether any user belongs to an organization."""
+        query = select(
+            select(col(User.id)).where(User.organization_id == org_id).exists()
+        )
+        result = await self.db.execute(query)
+        return bool(result.scalar())
+
     async def get_organization_user_count(self, org_id: int) -> int:
         """Get the count of users in an organization."""
         query = select(func.count(User.id)).where(User.organization_id == org_id)
@@ -169,9 +195,7 @@ class OrganizationService:
 
     async def user_has_organization_access(self, user_id: int, org_id: int) -> bool:
         """Check if a user has access to an organization."""
-        query = select(User).where(User.id == user_id)
-        result = await self.db.execute(query)
-        user = result.scalar_one_or_none()
+        user = await self.db.get(User, user_id)
 
         if not user:
             return False
@@ -191,9 +215,7 @@ class OrganizationService:
         1. They are a superuser
         2. They are an admin and belong to the organization
         """
-        query = select(User).where(User.id == user_id)
-        result = await self.db.execute(query)
-        user = result.scalar_one_or_none()
+        user = await self.db.get(User, user_id)
 
         if not user:
             return False
@@ -207,10 +229,27 @@ class OrganizationService:
         self, admin_user_id: int, org_id: int, user_id: int
     ) -> bool:
         """Check if a user can add another user to an organization."""
-        query = select(User).where(User.id == admin_user_id)
+        admin_user = await self.db.get(User, admin_user_id)
+        return self._can_add_to_organization(admin_user, org_id)
+
+    async def user_can_remove_user_from_organization(
+        self, admin_user_id: int, user_id: int
+    ) -> bool:
+        """Check if a user can remove another user from an organization."""
+        users = await self._get_users_by_id(admin_user_id, user_id)
+        return self._can_remove_from_organization(
+            users.get(admin_user_id), users.get(user_id)
+        )
+
+    async def _get_users_by_id(self, *user_ids: int | None) -> dict[int, User]:
+        """Load several users in one round-trip, keyed by ID."""
+        ids = {user_id for user_id in user_ids if user_id is not None}
+        query = select(User).where(col(User.id).in_(ids))
         result = await self.db.execute(query)
-        admin_user = result.scalar_one_or_none()
+        return {user.id: user for user in result.scalars().all() if user.id is not None}
 
+    @staticmethod
+    def _can_add_to_organization(admin_user: User | None, org_id: int) -> bool:
         if not admin_user:
             return False
 
@@ -221,19 +260,10 @@ class OrganizationService:
             admin_user.role == UserRole.ADMIN and admin_user.organization_id == org_id
         )
 
-    async def user_can_remove_user_from_organization(
-        self, admin_user_id: int, user_id: int
+    @staticmethod
+    def _can_remove_from_organization(
+        admin_user: User | None, user: User | None
     ) -> bool:
-        """Check if a user can remove another user from an organization."""
-        admin_query = select(User).where(User.id == admin_user_id)
-        user_query = select(User).where(User.id == user_id)
-
-        admin_result = await self.db.execute(admin_query)
-        user_result = await self.db.execute(user_query)
-
-        admin_user = admin_result.scalar_one_or_none()
-        user = user_result.scalar_one_or_none()
-
         if not admin_user or not user or user.organization_id is None:
             return False
 
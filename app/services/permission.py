@@ -19,6 +19,8 @@ CAPABILITY_MAP: dict[PermissionAction, str] = {
 
 
 class PermissionService:
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -19,6 +19,8 @@ def _hash_token(token: str) -> str:
 
 
 class TokenService:
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
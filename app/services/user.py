@@ -1,17 +1,33 @@
+import secrets
+import time
+import uuid
 from datetime import datetime, timedelta
+from functools import cache
 from typing import Any
 from zoneinfo import ZoneInfo
 
 import bcrypt
 import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import select
 
-from app.core.config import logger, settings
+from app.core.cache import TTLCache
+from app.core.config import JWT_ALGORITHM, JWT_KEY, logger, settings
 from app.db.models import User, UserRole
 
 UTC = ZoneInfo("UTC")
 
+# Detached snapshots of recently authenticated users, keyed by user ID.
+_user_cache: TTLCache[int, User] = TTLCache(
+    maxsize=5000, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop a user from the authenticated-user cache after it changes."""
+    _user_cache.pop(user_id)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(
@@ -20,16 +36,41 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 
 def get_password_hash(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+@cache
+def _dummy_password_hash() -> str:
+    """Hash checked against when no user matches, to equalize login timing."""
+    return get_password_hash(secrets.token_urlsafe())
 
 
 class UserService:
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_user_by_id(self, user_id: int) -> User | None:
-        result = await self.db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        return await self.db.get(User, user_id)
+
+    async def get_cached_user_by_id(self, user_id: int) -> User | None:
+        """Get a user by ID, serving recent lookups from the in-process cache.
+
+        Cached users are merged into this session without a round-trip, so the
+        returned instance behaves like one loaded from the database.
+        """
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            return await self.db.merge(cached, load=False)
+
+        user = await self.get_user_by_id(user_id)
+        if user is not None:
+            snapshot = User(**user.model_dump())
+            make_transient_to_detached(snapshot)
+            _user_cache.set(user_id, snapshot)
+        return user
 
     async def get_user_by_username(self, username: str) -> User | None:
         result = await self.db.execute(select(User).where(User.username == username))
@@ -39,6 +80,19 @@ class UserService:
         result = await self.db.execute(select(User).where(User.email == email))
         return result.scalar_one_or_none()
 
+    async def get_registration_state(
+        self, username: str, email: str
+    ) -> tuple[bool, bool, bool]:
+        """Return (username_taken, email_taken, any_user_exists) in one query."""
+        query = select(
+            select(User.id).where(User.username == username).exists(),
+            select(User.id).where(User.email == email).exists(),
+            select(User.id).exists(),
+        )
+        result = await self.db.execute(query)
+        username_taken, email_taken, any_user = result.one()
+        return username_taken, email_taken, any_user
+
     async def create_user(
         self,
         username: str,
@@ -55,6 +109,7 @@ class UserService:
         logger.debug("Creating user: %s, role: %s", username, role)
         hashed_password = get_password_hash(password)
 
+        now = datetime.now(UTC)
         user = User(
             username=username,
             email=email,
@@ -66,11 +121,12 @@ class UserService:
             can_revoke_cert=can_revoke_cert,
             can_export_private_key=can_export_private_key,
             can_delete_ca=can_delete_ca,
+            created_at=now,
+            updated_at=now,
         )
 
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
 
         logger.debug("User created successfully: %s with ID %s", username, user.id)
         return user
@@ -89,7 +145,8 @@ class UserService:
         can_export_private_key: bool | None = None,
         can_delete_ca: bool | None = None,
     ) -> User | None:
-        user = await self.get_user_by_id(user_id)
+        # Callers usually loaded the user already; reuse it from the identity map
+        user = await self.db.get(User, user_id)
 
         if not user:
             return None
@@ -139,18 +196,19 @@ class UserService:
 
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
+        invalidate_cached_user(user_id)
 
         return user
 
     async def delete_user(self, user_id: int) -> bool:
-        user = await self.get_user_by_id(user_id)
+        user = await self.db.get(User, user_id)
 
         if not user:
             return False
 
         await self.db.delete(user)
         await self.db.commit()
+        invalidate_cached_user(user_id)
 
         return True
 
@@ -160,6 +218,8 @@ class UserService:
 
         if not user:
             logger.debug("User not found: %s", username)
+            # Spend the same bcrypt time as a wrong password would
+            verify_password(password, _dummy_password_hash())
             return None
 
         if not user.is_active:
@@ -176,26 +236,23 @@ class UserService:
     def create_access_token(
         self, data: dict[str, Any], expires_delta: timedelta | None = None
     ) -> str:
-        import uuid
-
         to_encode = data.copy()
 
-        now = datetime.now(UTC)
+        # JWT times are plain Unix timestamps; no need for aware datetimes
+        now = int(time.time())
         if expires_delta:
-            expire = now + expires_delta
+            lifetime = int(expires_delta.total_seconds())
         else:
-            expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+            lifetime = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
         to_encode.update(
             {
-                "exp": int(expire.timestamp()),
-                "iat": int(now.timestamp()),
+                "exp": now + lifetime,
+                "iat": now,
                 "jti": str(uuid.uuid4()),
             }
         )
 
-        encoded_jwt: str = jwt.encode(
-            to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-        )
+        encoded_jwt: str = jwt.encode(to_encode, JWT_KEY, algorithm=JWT_ALGORITHM)
 
         return encoded_jwt
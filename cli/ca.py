@@ -59,9 +59,13 @@ app.callback(invoke_without_command=True)(_callback)
 
 
 @app.command("list")
-def list_cas() -> None:
+def list_cas(
+    skip: int = typer.Option(0, "--skip"),
+    limit: int = typer.Option(100, "--limit"),
+) -> None:
     """List all certificate authorities."""
-    data = client.get("/api/v1/cas/").json()
+    params = {"skip": skip, "limit": limit}
+    data = client.get("/api/v1/cas/", params=params).json()
     display_list(
         data, CA_LIST_COLUMNS, keys=CA_LIST_KEYS, title="Certificate Authorities"
     )
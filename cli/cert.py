@@ -39,6 +39,7 @@ CERT_DETAIL_FIELDS = [
     ("Type", "certificate_type"),
     ("Status", "status"),
     ("Serial Number", "serial_number"),
+    ("Key Algorithm", "key_algorithm"),
     ("Key Size", "key_size"),
     ("Valid Days", "valid_days"),
     ("Not Before", "not_before"),
@@ -88,6 +89,9 @@ def create(
     cert_type: str = typer.Option(
         "server", "--type", "-t", help="Certificate type: server, client, ca"
     ),
+    key_algorithm: str | None = typer.Option(
+        None, "--key-algorithm", "-a", help="Key algorithm: rsa, ecdsa_p256, ed25519"
+    ),
     key_size: int | None = typer.Option(None, "--key-size", "-k"),
     valid_days: int | None = typer.Option(None, "--valid-days", "-v"),
     no_private_key: bool = typer.Option(
@@ -110,6 +114,8 @@ def create(
         "certificate_type": cert_type,
         "include_private_key": not no_private_key,
     }
+    if key_algorithm:
+        payload["key_algorithm"] = key_algorithm
     ks = key_size or get_default("cert_key_size")
     if ks:
         payload["key_size"] = int(ks)
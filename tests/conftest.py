@@ -1,15 +1,19 @@
-import asyncio
+import itertools
 import logging
-import os
-from collections.abc import AsyncGenerator
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
 from datetime import timedelta
+from functools import cache
 
 import pytest
 import pytest_asyncio
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 
 from app.api import api_router
@@ -22,23 +26,42 @@ from app.api.deps import (
 from app.core.config import logger, settings
 from app.db.models import User, UserRole
 from app.db.session import get_session
+from app.services.ca import CAService
 from app.services.organization import OrganizationService
 from app.services.user import UserService
 
 # Set logger to DEBUG for tests
 logger.setLevel(logging.DEBUG)
 
+# Minimum bcrypt cost; hashing strength is irrelevant to the tests
+settings.BCRYPT_ROUNDS = 4
+
 
 # Test database
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-# Create async engine for tests
+# Create async engine for tests; every connection to :memory: opens its own
+# empty database, so share a single one for the whole run. Under pytest-xdist
+# each worker is a separate process and so gets a database of its own.
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
-    poolclass=NullPool,
+    poolclass=StaticPool,
     connect_args={"check_same_thread": False},
 )
 
+
+# pysqlite defers BEGIN to the first write, which breaks SAVEPOINT handling;
+# turn off its transaction management and emit BEGIN ourselves
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_pysqlite_begin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
 # Create test session
 test_session_maker = async_sessionmaker(
     test_engine, class_=AsyncSession, expire_on_commit=False
@@ -50,19 +73,40 @@ async def get_test_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-# App for testing
-def create_test_app() -> FastAPI:
+@contextmanager
+def recorded_statements(db: AsyncSession) -> Iterator[list[str]]:
+    """Collect the SQL statements ``db`` sends to the database inside the block."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@cache
+def _build_test_app() -> FastAPI:
     app = FastAPI()
     app.include_router(api_router, prefix=settings.API_V1_STR)
     return app
 
 
-@pytest_asyncio.fixture(scope="session")
-async def event_loop():
-    """Create an event loop for testing."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# App for testing
+def create_test_app() -> FastAPI:
+    """Return the shared test app with its dependency overrides cleared.
+
+    Mounting the API router rebuilds every route, which costs tens of
+    milliseconds, so the app is built once. No test drives two apps at the
+    same time, so handing out the same instance with fresh overrides is safe.
+    """
+    app = _build_test_app()
+    app.dependency_overrides.clear()
+    return app
 
 
 @pytest.fixture(autouse=True)
@@ -75,28 +119,68 @@ def reset_rate_limiter():
     limiter.reset()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def setup_db():
-    # Create the test database and tables
-    # Log the setup
-    logger.debug("Setting up test database")
+# RSA key generation dominates the suite's runtime, so tests draw from a small
+# set of keys generated once per process instead of making fresh ones
+_RSA_KEYS_PER_SIZE = 8
+_rsa_keys: dict[int, list[tuple[rsa.RSAPrivateKey, bytes]]] = {}
+_generate_key_pair = CAService.generate_key_pair
+
 
-    # Remove existing test database file first
-    if os.path.exists("./test.db"):
-        os.remove("./test.db")
+@pytest.fixture(autouse=True)
+def pooled_rsa_keys(monkeypatch):
+    """Hand out pre-generated RSA keys, distinct within a test, per key size."""
+    counters: defaultdict[int, itertools.count[int]] = defaultdict(itertools.count)
+
+    def generate_key_pair(key_size: int = 2048) -> tuple[rsa.RSAPrivateKey, bytes]:
+        keys = _rsa_keys.setdefault(key_size, [])
+        index = next(counters[key_size]) % _RSA_KEYS_PER_SIZE
+        if index == len(keys):
+            keys.append(_generate_key_pair(key_size))
+        return keys[index]
+
+    monkeypatch.setattr(CAService, "generate_key_pair", staticmethod(generate_key_pair))
+
+
+@pytest.fixture(autouse=True)
+def reset_user_cache():
+    """Clear cached users so IDs reused by a fresh test database never collide."""
+    from app.services.user import _user_cache
 
+    _user_cache.clear()
+    yield
+    _user_cache.clear()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def create_schema():
+    logger.debug("Creating test database schema")
     async with test_engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
         await conn.run_sync(SQLModel.metadata.create_all)
     yield
-    # Clean up after tests
-    logger.debug("Tearing down test database")
-    async with test_engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
+    # Closing the only connection discards the in-memory database
+    await test_engine.dispose()
+
 
-    # Remove test database file
-    if os.path.exists("./test.db"):
-        os.remove("./test.db")
+@pytest_asyncio.fixture(scope="function")
+async def setup_db(create_schema):
+    """Run the test inside a transaction that is rolled back afterwards.
+
+    Every session made by ``test_session_maker`` joins that transaction, so
+    their commits only release a SAVEPOINT and nothing outlives the test.
+    """
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        test_session_maker.configure(
+            bind=conn, join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield conn
+        finally:
+            test_session_maker.configure(
+                bind=test_engine, join_transaction_mode="conservative_savepoint"
+            )
+            logger.debug("Rolling back test database")
+            await transaction.rollback()
 
 
 @pytest_asyncio.fixture
@@ -131,52 +215,49 @@ async def test_org(db) -> "Organization":  # noqa: F821
     )
 
 
+@pytest_asyncio.fixture
+async def seed_ca(db) -> "CertificateAuthority":  # noqa: F821
+    """Create and return a root CA for tests that only issue from or read it."""
+    ca_service = CAService(db)
+    return await ca_service.create_ca(
+        name="Seed CA", subject_dn="CN=Seed CA,O=Test Organization,C=US"
+    )
+
+
 # User fixtures for testing
 @pytest_asyncio.fixture
 async def superuser(db) -> User:
     """Create and return a superuser for testing."""
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username("testsuper")
-    if not user:
-        user = await user_service.create_user(
-            username="testsuper",
-            email="super@example.com",
-            password="password123",
-            role=UserRole.SUPERUSER,
-        )
-    return user
+    return await UserService(db).create_user(
+        username="testsuper",
+        email="super@example.com",
+        password="password123",
+        role=UserRole.SUPERUSER,
+    )
 
 
 @pytest_asyncio.fixture
 async def admin_user(db, test_org) -> User:
     """Create and return an admin user in the test org."""
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username("testadmin")
-    if not user:
-        user = await user_service.create_user(
-            username="testadmin",
-            email="admin@example.com",
-            password="password123",
-            role=UserRole.ADMIN,
-            organization_id=test_org.id,
-        )
-    return user
+    return await UserService(db).create_user(
+        username="testadmin",
+        email="admin@example.com",
+        password="password123",
+        role=UserRole.ADMIN,
+        organization_id=test_org.id,
+    )
 
 
 @pytest_asyncio.fixture
 async def normal_user(db, test_org) -> User:
     """Create and return a normal user in the test org."""
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username("testuser")
-    if not user:
-        user = await user_service.create_user(
-            username="testuser",
-            email="user@example.com",
-            password="password123",
-            role=UserRole.USER,
-            organization_id=test_org.id,
-        )
-    return user
+    return await UserService(db).create_user(
+        username="testuser",
+        email="user@example.com",
+        password="password123",
+        role=UserRole.USER,
+        organization_id=test_org.id,
+    )
 
 
 # Token fixtures
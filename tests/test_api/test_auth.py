@@ -5,6 +5,7 @@ import pytest
 
 from app.core.config import logger, settings
 from app.db.models import UserRole
+from app.services.user import UserService
 
 # Set logging to debug for tests
 logger.setLevel(logging.DEBUG)
@@ -19,7 +20,7 @@ async def test_login_success(client, db):
         "password": "password123",
     }
 
-    await client.post("/api/v1/users/", json=user_data)
+    await UserService(db).create_user(**user_data)
 
     # Try to login
     # Using form data directly in the request below
@@ -44,78 +45,16 @@ async def test_login_success(client, db):
 
 
 @pytest.mark.asyncio
-async def test_login_invalid_credentials(client, db):
-    # Create a test user first
-    user_data = {
-        "username": "invalidtest",
-        "email": "invalid@example.com",
-        "password": "password123",
-    }
-
-    await client.post("/api/v1/users/", json=user_data)
-
-    # Try to login with wrong password
-    # Using form data directly in the request below
-
-    response = await client.post(
-        "/api/v1/auth/token",
-        data={"username": "invalidtest", "password": "wrongpassword"},
-    )
-
-    assert response.status_code == 401
-    data = response.json()
-    assert "detail" in data
-    assert data["detail"] == "Incorrect username or password"
-
-
-@pytest.mark.asyncio
-async def test_login_nonexistent_user(client):
-    # Try to login with non-existent user (with timestamp to ensure it doesn't exist)
-    import time
-
-    unique_id = int(time.time() * 1000)
-
-    login_data = {"username": f"nonexistentuser_{unique_id}", "password": "anypassword"}
-
-    response = await client.post(
-        "/api/v1/auth/token",
-        data={"username": login_data["username"], "password": "anypassword"},
-    )
-
-    assert response.status_code == 401
-    data = response.json()
-    assert "detail" in data
-    assert data["detail"] == "Incorrect username or password"
-
-
-@pytest.mark.asyncio
-async def test_access_protected_endpoint(client, db):
-    # Create a test user
-    user_data = {
-        "username": "protecteduser",
-        "email": "protected@example.com",
-        "password": "password123",
-    }
-
-    await client.post("/api/v1/users/", json=user_data)
-
-    # Login to get a token
-    # Using form data directly in the request below
-
-    login_response = await client.post(
-        "/api/v1/auth/token",
-        data={"username": "protecteduser", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
-
+async def test_access_protected_endpoint(
+    client, normal_user, normal_user_token_headers
+):
     # Access a protected endpoint with token
-    headers = {"Authorization": f"Bearer {token}"}
-    response = await client.get("/api/v1/users/me", headers=headers)
+    response = await client.get("/api/v1/users/me", headers=normal_user_token_headers)
 
     assert response.status_code == 200
     data = response.json()
-    assert data["username"] == "protecteduser"
-    assert data["email"] == "protected@example.com"
+    assert data["username"] == normal_user.username
+    assert data["email"] == normal_user.email
 
 
 @pytest.mark.asyncio
@@ -141,43 +80,18 @@ async def test_access_protected_endpoint_invalid_token(client):
 
 
 @pytest.mark.asyncio
-async def test_user_can_create_regular_user(client, db):
+async def test_user_can_create_regular_user(client, normal_user_token_headers):
     # Test to verify a user can create another regular user
-    # First create a regular user
-    import time
-
-    unique_id = int(time.time() * 1000)
-
-    user_data = {
-        "username": f"user_{unique_id}",
-        "email": f"user_{unique_id}@example.com",
-        "password": "password123",
-    }
-
-    # Create user
-    create_response = await client.post("/api/v1/users/", json=user_data)
-    assert create_response.status_code == 201
-
-    # Login as user
-    login_response = await client.post(
-        "/api/v1/auth/token",
-        data={"username": user_data["username"], "password": "password123"},
-    )
-
-    assert login_response.status_code == 200
-    token = login_response.json()["access_token"]
-
-    # Create another regular user
-    unique_id_2 = int(time.time() * 1000) + 1
     new_user_data = {
-        "username": f"new_user_{unique_id_2}",
-        "email": f"new_{unique_id_2}@example.com",
+        "username": "createdregular",
+        "email": "createdregular@example.com",
         "password": "userpass",
         "role": UserRole.USER.value,  # Regular user role
     }
 
-    headers = {"Authorization": f"Bearer {token}"}
-    response = await client.post("/api/v1/users/", json=new_user_data, headers=headers)
+    response = await client.post(
+        "/api/v1/users/", json=new_user_data, headers=normal_user_token_headers
+    )
 
     assert response.status_code == 201
     data = response.json()
@@ -186,29 +100,7 @@ async def test_user_can_create_regular_user(client, db):
 
 
 @pytest.mark.asyncio
-async def test_regular_user_cannot_create_admin(client, db):
-    # Create a unique regular user - use timestamp to ensure uniqueness
-    import time
-
-    unique_id = int(time.time() * 1000)
-
-    user_data = {
-        "username": f"regularuser_{unique_id}",
-        "email": f"regular_{unique_id}@example.com",
-        "password": "userpass",
-    }
-
-    await client.post("/api/v1/users/", json=user_data)
-
-    # Login as regular user
-    # Using form data directly in the request below
-
-    login_response = await client.post(
-        "/api/v1/auth/token",
-        data={"username": user_data["username"], "password": "userpass"},
-    )
-    token = login_response.json()["access_token"]
-
+async def test_regular_user_cannot_create_admin(client, normal_user_token_headers):
     # Try to create an admin user
     new_user_data = {
         "username": "attempted_admin",
@@ -217,8 +109,9 @@ async def test_regular_user_cannot_create_admin(client, db):
         "role": UserRole.ADMIN.value,
     }
 
-    headers = {"Authorization": f"Bearer {token}"}
-    response = await client.post("/api/v1/users/", json=new_user_data, headers=headers)
+    response = await client.post(
+        "/api/v1/users/", json=new_user_data, headers=normal_user_token_headers
+    )
 
     # Should be forbidden
     assert response.status_code == 403
@@ -231,7 +124,7 @@ async def test_login_returns_refresh_token(client, db):
         "email": "refreshlogin@example.com",
         "password": "password123",
     }
-    await client.post("/api/v1/users/", json=user_data)
+    await UserService(db).create_user(**user_data)
 
     response = await client.post(
         "/api/v1/auth/token",
@@ -253,7 +146,7 @@ async def test_refresh_token_endpoint(client, db):
         "email": "refresh@example.com",
         "password": "password123",
     }
-    await client.post("/api/v1/users/", json=user_data)
+    await UserService(db).create_user(**user_data)
 
     login_response = await client.post(
         "/api/v1/auth/token",
@@ -290,7 +183,7 @@ async def test_refresh_token_reuse_rejected(client, db):
         "email": "reuse@example.com",
         "password": "password123",
     }
-    await client.post("/api/v1/users/", json=user_data)
+    await UserService(db).create_user(**user_data)
 
     login_response = await client.post(
         "/api/v1/auth/token",
@@ -317,7 +210,7 @@ async def test_logout_endpoint(client, db):
         "email": "logout@example.com",
         "password": "password123",
     }
-    await client.post("/api/v1/users/", json=user_data)
+    await UserService(db).create_user(**user_data)
 
     login_response = await client.post(
         "/api/v1/auth/token",
@@ -348,7 +241,7 @@ async def test_invalidate_endpoint(client, db):
         "email": "invalidate@example.com",
         "password": "password123",
     }
-    await client.post("/api/v1/users/", json=user_data)
+    await UserService(db).create_user(**user_data)
 
     login1 = await client.post(
         "/api/v1/auth/token",
@@ -398,8 +291,8 @@ async def test_refresh_token_with_deactivated_user(client, db):
         "email": "deactrefresh@example.com",
         "password": "password123",
     }
-    create_resp = await client.post("/api/v1/users/", json=user_data)
-    user_id = create_resp.json()["id"]
+    user = await UserService(db).create_user(**user_data)
+    user_id = user.id
 
     await client.post(
         "/api/v1/auth/token",
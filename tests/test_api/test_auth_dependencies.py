@@ -45,51 +45,6 @@ async def auth_test_user(db: AsyncSession) -> User:
     return user
 
 
-@pytest_asyncio.fixture
-async def auth_test_admin(db: AsyncSession) -> User:
-    """Create a test admin for auth tests."""
-    user_service = UserService(db)
-    user = await user_service.create_user(
-        username="authadmin",
-        email="authadmin@example.com",
-        password="password123",
-        role=UserRole.ADMIN,
-    )
-    return user
-
-
-@pytest_asyncio.fixture
-async def auth_test_superuser(db: AsyncSession) -> User:
-    """Create a test superuser for auth tests."""
-    user_service = UserService(db)
-    user = await user_service.create_user(
-        username="authsuper",
-        email="authsuper@example.com",
-        password="password123",
-        role=UserRole.SUPERUSER,
-    )
-    return user
-
-
-@pytest_asyncio.fixture
-async def auth_test_inactive_user(db: AsyncSession) -> User:
-    """Create an inactive test user for auth tests."""
-    user_service = UserService(db)
-    # Create a user then deactivate it
-    user = await user_service.create_user(
-        username="authinactive",
-        email="authinactive@example.com",
-        password="password123",
-        role=UserRole.USER,
-    )
-    # Set inactive status directly
-    user.is_active = False
-    db.add(user)
-    await db.commit()
-    await db.refresh(user)
-    return user
-
-
 @pytest.mark.asyncio
 async def test_login_for_access_token_success(db: AsyncSession, auth_test_user: User):
     """Test successful login and token generation."""
@@ -116,12 +71,17 @@ async def test_login_for_access_token_success(db: AsyncSession, auth_test_user:
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("username", "password"),
+    [("authuser", "wrongpassword"), ("nonexistentuser", "anypassword")],
+    ids=["wrong_password", "unknown_user"],
+)
 async def test_login_for_access_token_invalid_credentials(
-    db: AsyncSession, auth_test_user: User
+    db: AsyncSession, auth_test_user: User, username: str, password: str
 ):
-    """Test login with invalid credentials."""
+    """Test login with a wrong password or an unknown username."""
     form_data = OAuth2PasswordRequestForm(
-        username=auth_test_user.username, password="wrongpassword", scope=""
+        username=username, password=password, scope=""
     )
 
     with pytest.raises(HTTPException) as exc_info:
@@ -155,85 +115,58 @@ async def test_get_current_user_success(db: AsyncSession, auth_test_user: User):
 
 
 @pytest.mark.asyncio
-async def test_get_current_active_user_success(db: AsyncSession, auth_test_user: User):
-    """Test getting current active user."""
-    # This is a simple passthrough function, so just verify it returns the user
-    user = await get_current_active_user(current_user=auth_test_user)
-
-    assert user is not None
-    assert user.id == auth_test_user.id
-
-
-@pytest.mark.asyncio
-async def test_get_current_active_user_inactive(
-    db: AsyncSession, auth_test_inactive_user: User
-):
-    """Test getting current active user with an inactive user."""
-    with pytest.raises(HTTPException) as exc_info:
-        await get_current_active_user(current_user=auth_test_inactive_user)
-
-    assert exc_info.value.status_code == 400
-    assert "Inactive user" in exc_info.value.detail
-
-
-@pytest.mark.asyncio
-async def test_get_current_active_superuser_success(
-    db: AsyncSession, auth_test_superuser: User
-):
-    """Test getting current superuser with a superuser."""
-    user = await get_current_active_superuser(current_user=auth_test_superuser)
-
-    assert user is not None
-    assert user.id == auth_test_superuser.id
-    assert user.role == UserRole.SUPERUSER
-
-
-@pytest.mark.asyncio
-async def test_get_current_active_superuser_not_superuser(
-    db: AsyncSession, auth_test_user: User
-):
-    """Test getting current superuser with a non-superuser."""
-    with pytest.raises(HTTPException) as exc_info:
-        await get_current_active_superuser(current_user=auth_test_user)
-
-    assert exc_info.value.status_code == 403
-    assert "sufficient privileges" in exc_info.value.detail
-
-
-@pytest.mark.asyncio
-async def test_get_current_active_admin_user_admin(
-    db: AsyncSession, auth_test_admin: User
-):
-    """Test getting current admin or superuser with an admin."""
-    user = await get_current_active_admin_user(current_user=auth_test_admin)
-
-    assert user is not None
-    assert user.id == auth_test_admin.id
-    assert user.role == UserRole.ADMIN
-
-
-@pytest.mark.asyncio
-async def test_get_current_active_admin_user_superuser(
-    db: AsyncSession, auth_test_superuser: User
-):
-    """Test getting current admin or superuser with a superuser."""
-    user = await get_current_active_admin_user(current_user=auth_test_superuser)
-
-    assert user is not None
-    assert user.id == auth_test_superuser.id
-    assert user.role == UserRole.SUPERUSER
+@pytest.mark.parametrize(
+    ("dependency", "role", "is_active", "error"),
+    [
+        (get_current_active_user, UserRole.USER, True, None),
+        (get_current_active_user, UserRole.USER, False, (400, "Inactive user")),
+        (get_current_active_superuser, UserRole.SUPERUSER, True, None),
+        (
+            get_current_active_superuser,
+            UserRole.USER,
+            True,
+            (403, "sufficient privileges"),
+        ),
+        (get_current_active_admin_user, UserRole.ADMIN, True, None),
+        (get_current_active_admin_user, UserRole.SUPERUSER, True, None),
+        (
+            get_current_active_admin_user,
+            UserRole.USER,
+            True,
+            (403, "sufficient privileges"),
+        ),
+    ],
+    ids=[
+        "active_user",
+        "active_user_inactive",
+        "superuser",
+        "superuser_not_superuser",
+        "admin_user_admin",
+        "admin_user_superuser",
+        "admin_user_not_admin",
+    ],
+)
+async def test_get_current_active_role_checks(dependency, role, is_active, error):
+    """The role and active-state dependencies only inspect the resolved user."""
+    user = User(
+        id=1,
+        username="authrole",
+        email="authrole@example.com",
+        hashed_password="unused",
+        role=role,
+        is_active=is_active,
+    )
 
+    if error is None:
+        assert await dependency(current_user=user) is user
+        return
 
-@pytest.mark.asyncio
-async def test_get_current_active_admin_user_not_admin(
-    db: AsyncSession, auth_test_user: User
-):
-    """Test getting current admin or superuser with a regular user."""
+    status_code, detail = error
     with pytest.raises(HTTPException) as exc_info:
-        await get_current_active_admin_user(current_user=auth_test_user)
+        await dependency(current_user=user)
 
-    assert exc_info.value.status_code == 403
-    assert "sufficient privileges" in exc_info.value.detail
+    assert exc_info.value.status_code == status_code
+    assert detail in exc_info.value.detail
 
 
 @pytest.mark.asyncio
@@ -35,20 +35,7 @@ async def test_create_ca(superuser_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_cas(superuser_client: AsyncClient):
-    # First create a CA
-    ca_data = {
-        "name": "Another CA",
-        "subject_dn": "CN=Another CA,O=Test Organization,C=US",
-    }
-
-    response = await superuser_client.post(
-        f"{settings.API_V1_STR}/cas/",
-        json=ca_data,
-    )
-    assert response.status_code == status.HTTP_201_CREATED
-
-    # Now test getting the list of CAs
+async def test_get_cas(superuser_client: AsyncClient, seed_ca):
     response = await superuser_client.get(f"{settings.API_V1_STR}/cas/")
 
     assert response.status_code == status.HTTP_200_OK
@@ -62,51 +49,50 @@ async def test_get_cas(superuser_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_ca(superuser_client: AsyncClient):
-    # First create a CA
-    ca_data = {
-        "name": "CA to Get",
-        "subject_dn": "CN=CA to Get,O=Test Organization,C=US",
-    }
+async def test_get_cas_paginated(superuser_client: AsyncClient):
+    ids = []
+    for i in range(3):
+        response = await superuser_client.post(
+            f"{settings.API_V1_STR}/cas/",
+            json={"name": f"Page CA {i}", "subject_dn": f"CN=Page CA {i}"},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        ids.append(response.json()["id"])
 
-    response = await superuser_client.post(
-        f"{settings.API_V1_STR}/cas/",
-        json=ca_data,
+    response = await superuser_client.get(
+        f"{settings.API_V1_STR}/cas/", params={"skip": 1, "limit": 1}
     )
-    assert response.status_code == status.HTTP_201_CREATED
-    created_ca = response.json()
-    ca_id = created_ca["id"]
+    assert response.status_code == status.HTTP_200_OK
+    assert [ca["id"] for ca in response.json()] == [ids[1]]
+
+    response = await superuser_client.get(
+        f"{settings.API_V1_STR}/cas/", params={"limit": 0}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-    # Now test getting a specific CA
+
+@pytest.mark.asyncio
+async def test_get_ca(superuser_client: AsyncClient, seed_ca):
+    ca_id = seed_ca.id
+
+    # Getting a specific CA
     response = await superuser_client.get(f"{settings.API_V1_STR}/cas/{ca_id}")
 
     assert response.status_code == status.HTTP_200_OK
     retrieved_ca = response.json()
 
     assert retrieved_ca["id"] == ca_id
-    assert retrieved_ca["name"] == ca_data["name"]
-    assert retrieved_ca["subject_dn"] == ca_data["subject_dn"]
+    assert retrieved_ca["name"] == seed_ca.name
+    assert retrieved_ca["subject_dn"] == seed_ca.subject_dn
     assert "certificate" in retrieved_ca
     assert "private_key" not in retrieved_ca  # Private key not included
 
 
 @pytest.mark.asyncio
-async def test_get_ca_private_key(superuser_client: AsyncClient):
-    # First create a CA
-    ca_data = {
-        "name": "CA with Private Key",
-        "subject_dn": "CN=CA with Private Key,O=Test Organization,C=US",
-    }
-
-    response = await superuser_client.post(
-        f"{settings.API_V1_STR}/cas/",
-        json=ca_data,
-    )
-    assert response.status_code == status.HTTP_201_CREATED
-    created_ca = response.json()
-    ca_id = created_ca["id"]
+async def test_get_ca_private_key(superuser_client: AsyncClient, seed_ca):
+    ca_id = seed_ca.id
 
-    # Now test getting a specific CA with private key
+    # Getting a specific CA with private key
     response = await superuser_client.get(
         f"{settings.API_V1_STR}/cas/{ca_id}/private-key"
     )
@@ -115,8 +101,8 @@ async def test_get_ca_private_key(superuser_client: AsyncClient):
     retrieved_ca = response.json()
 
     assert retrieved_ca["id"] == ca_id
-    assert retrieved_ca["name"] == ca_data["name"]
-    assert retrieved_ca["subject_dn"] == ca_data["subject_dn"]
+    assert retrieved_ca["name"] == seed_ca.name
+    assert retrieved_ca["subject_dn"] == seed_ca.subject_dn
     assert "certificate" in retrieved_ca
     assert "private_key" in retrieved_ca  # Private key is included
 
@@ -6,20 +6,8 @@ from app.core.config import settings
 
 
 @pytest.mark.asyncio
-async def test_create_certificate(superuser_client: AsyncClient):
-    # First create a CA
-    ca_data = {
-        "name": "Test CA for Certs",
-        "subject_dn": "CN=Test CA for Certs,O=Test Organization,C=US",
-    }
-
-    response = await superuser_client.post(
-        f"{settings.API_V1_STR}/cas/",
-        json=ca_data,
-    )
-    assert response.status_code == status.HTTP_201_CREATED
-    created_ca = response.json()
-    ca_id = created_ca["id"]
+async def test_create_certificate(superuser_client: AsyncClient, seed_ca):
+    ca_id = seed_ca.id
 
     # Now create a certificate
     cert_data = {
@@ -42,6 +30,7 @@ async def test_create_certificate(superuser_client: AsyncClient):
     assert created_cert["common_name"] == cert_data["common_name"]
     assert created_cert["subject_dn"] == cert_data["subject_dn"]
     assert created_cert["certificate_type"] == cert_data["certificate_type"]
+    assert created_cert["key_algorithm"] == "rsa"
     assert created_cert["key_size"] == cert_data["key_size"]
     assert created_cert["valid_days"] == cert_data["valid_days"]
     assert created_cert["status"] == "valid"
@@ -52,20 +41,30 @@ async def test_create_certificate(superuser_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_certificates(superuser_client: AsyncClient):
-    # First create a CA
-    ca_data = {
-        "name": "Another CA for Certs",
-        "subject_dn": "CN=Another CA for Certs,O=Test Organization,C=US",
-    }
+async def test_create_certificate_with_key_algorithm(
+    superuser_client: AsyncClient, seed_ca
+):
+    ca_id = seed_ca.id
 
     response = await superuser_client.post(
-        f"{settings.API_V1_STR}/cas/",
-        json=ca_data,
+        f"{settings.API_V1_STR}/certificates/?ca_id={ca_id}",
+        json={
+            "common_name": "ed25519.example.com",
+            "subject_dn": "CN=ed25519.example.com",
+            "certificate_type": "server",
+            "key_algorithm": "ed25519",
+        },
     )
+
     assert response.status_code == status.HTTP_201_CREATED
-    created_ca = response.json()
-    ca_id = created_ca["id"]
+    created_cert = response.json()
+    assert created_cert["key_algorithm"] == "ed25519"
+    assert created_cert["key_size"] == 256
+
+
+@pytest.mark.asyncio
+async def test_get_certificates(superuser_client: AsyncClient, seed_ca):
+    ca_id = seed_ca.id
 
     # Create a certificate
     cert_data = {
@@ -106,20 +105,8 @@ async def test_get_certificates(superuser_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_certificate(superuser_client: AsyncClient):
-    # First create a CA
-    ca_data = {
-        "name": "CA for Cert Detail",
-        "subject_dn": "CN=CA for Cert Detail,O=Test Organization,C=US",
-    }
-
-    response = await superuser_client.post(
-        f"{settings.API_V1_STR}/cas/",
-        json=ca_data,
-    )
-    assert response.status_code == status.HTTP_201_CREATED
-    created_ca = response.json()
-    ca_id = created_ca["id"]
+async def test_get_certificate(superuser_client: AsyncClient, seed_ca):
+    ca_id = seed_ca.id
 
     # Create a certificate
     cert_data = {
@@ -152,20 +139,8 @@ async def test_get_certificate(superuser_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_certificate_with_private_key(superuser_client: AsyncClient):
-    # First create a CA
-    ca_data = {
-        "name": "CA for Cert with Key",
-        "subject_dn": "CN=CA for Cert with Key,O=Test Organization,C=US",
-    }
-
-    response = await superuser_client.post(
-        f"{settings.API_V1_STR}/cas/",
-        json=ca_data,
-    )
-    assert response.status_code == status.HTTP_201_CREATED
-    created_ca = response.json()
-    ca_id = created_ca["id"]
+async def test_get_certificate_with_private_key(superuser_client: AsyncClient, seed_ca):
+    ca_id = seed_ca.id
 
     # Create a certificate
     cert_data = {
@@ -199,20 +174,8 @@ async def test_get_certificate_with_private_key(superuser_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_revoke_certificate(superuser_client: AsyncClient):
-    # First create a CA
-    ca_data = {
-        "name": "CA for Revoke Test",
-        "subject_dn": "CN=CA for Revoke Test,O=Test Organization,C=US",
-    }
-
-    response = await superuser_client.post(
-        f"{settings.API_V1_STR}/cas/",
-        json=ca_data,
-    )
-    assert response.status_code == status.HTTP_201_CREATED
-    created_ca = response.json()
-    ca_id = created_ca["id"]
+async def test_revoke_certificate(superuser_client: AsyncClient, seed_ca):
+    ca_id = seed_ca.id
 
     # Create a certificate
     cert_data = {
@@ -1,146 +1,73 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import jwt
 import pytest
-from fastapi import HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import (
-    get_current_active_admin_user,
-    get_current_active_superuser,
-    get_current_active_user,
-)
-from app.db.models import UserRole
+from app.api.deps import _decode_token, _token_cache
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.services.user import UserService
 
 
-@pytest.mark.asyncio
-async def test_get_current_active_user_success(db: AsyncSession):
-    """Test get_current_active_user with an active user."""
-    # Create a test user directly
-    user_service = UserService(db)
-    user = await user_service.create_user(
-        username="active_test_user",
-        email="active_test_user@example.com",
-        password="password123",
-        role=UserRole.USER,
+def test_decode_token_caches_successful_decodes():
+    """A token is only verified once while its payload is cached."""
+    token = UserService(None).create_access_token(
+        data={"sub": "cached", "id": 1}, expires_delta=timedelta(minutes=5)
     )
+    with patch("app.api.deps.jwt.decode", wraps=jwt.decode) as decode:
+        first = _decode_token(token)
+        second = _decode_token(token)
 
-    active_user = await get_current_active_user(current_user=user)
-    assert active_user is not None
-    assert active_user.id == user.id
-    assert active_user.is_active is True
-
-
-@pytest.mark.asyncio
-async def test_get_current_active_user_inactive(db: AsyncSession):
-    """Test get_current_active_user with an inactive user."""
-    # Create a test user directly
-    user_service = UserService(db)
-    user = await user_service.create_user(
-        username="inactive_test_user",
-        email="inactive_test_user@example.com",
-        password="password123",
-        role=UserRole.USER,
-    )
+    assert first == second
+    assert first["sub"] == "cached"
+    decode.assert_called_once()
 
-    # Set inactive status directly
-    user.is_active = False
-    db.add(user)
-    await db.commit()
-    await db.refresh(user)
-
-    with pytest.raises(HTTPException) as exc_info:
-        await get_current_active_user(current_user=user)
-
-    assert exc_info.value.status_code == 400
-    assert "Inactive user" in exc_info.value.detail
-
-
-@pytest.mark.asyncio
-async def test_get_current_active_superuser_success(db: AsyncSession):
-    """Test get_current_active_superuser with a superuser."""
-    # Create a test superuser directly
-    user_service = UserService(db)
-    user = await user_service.create_user(
-        username="super_test_user",
-        email="super_test_user@example.com",
-        password="password123",
-        role=UserRole.SUPERUSER,
-    )
 
-    superuser = await get_current_active_superuser(current_user=user)
-    assert superuser is not None
-    assert superuser.id == user.id
-    assert superuser.role == UserRole.SUPERUSER
-
-
-@pytest.mark.asyncio
-async def test_get_current_active_superuser_not_superuser(db: AsyncSession):
-    """Test get_current_active_superuser with a non-superuser."""
-    # Create a regular user
-    user_service = UserService(db)
-    user = await user_service.create_user(
-        username="regular_test_user",
-        email="regular_test_user@example.com",
-        password="password123",
-        role=UserRole.USER,
+def test_token_round_trip_ignores_later_settings_changes(monkeypatch):
+    """Encode and decode share one key binding that settings changes cannot split."""
+    monkeypatch.setattr(settings, "SECRET_KEY", "x" * 40)
+    token = UserService(None).create_access_token(
+        data={"sub": "rebound", "id": 2}, expires_delta=timedelta(minutes=5)
     )
 
-    with pytest.raises(HTTPException) as exc_info:
-        await get_current_active_superuser(current_user=user)
+    assert _decode_token(token)["sub"] == "rebound"
 
-    assert exc_info.value.status_code == 403
-    assert "sufficient privileges" in exc_info.value.detail
 
+def test_decode_token_does_not_cache_failures():
+    """Invalid tokens are re-checked on every call."""
+    size = len(_token_cache)
+    for _ in range(2):
+        with pytest.raises(jwt.InvalidTokenError):
+            _decode_token("not.a.jwt")
+    assert len(_token_cache) == size
 
-@pytest.mark.asyncio
-async def test_get_current_active_admin_user_admin(db: AsyncSession):
-    """Test get_current_active_admin_user with an admin."""
-    # Create an admin user
-    user_service = UserService(db)
-    user = await user_service.create_user(
-        username="admin_test_user",
-        email="admin_test_user@example.com",
-        password="password123",
-        role=UserRole.ADMIN,
-    )
 
-    admin_user = await get_current_active_admin_user(current_user=user)
-    assert admin_user is not None
-    assert admin_user.id == user.id
-    assert admin_user.role == UserRole.ADMIN
-
-
-@pytest.mark.asyncio
-async def test_get_current_active_admin_user_superuser(db: AsyncSession):
-    """Test get_current_active_admin_user with a superuser."""
-    # Create a superuser
-    user_service = UserService(db)
-    user = await user_service.create_user(
-        username="super_admin_test_user",
-        email="super_admin_test_user@example.com",
-        password="password123",
-        role=UserRole.SUPERUSER,
-    )
-
-    super_admin_user = await get_current_active_admin_user(current_user=user)
-    assert super_admin_user is not None
-    assert super_admin_user.id == user.id
-    assert super_admin_user.role == UserRole.SUPERUSER
-
-
-@pytest.mark.asyncio
-async def test_get_current_active_admin_user_not_admin(db: AsyncSession):
-    """Test get_current_active_admin_user with a regular user."""
-    # Create a regular user
-    user_service = UserService(db)
-    user = await user_service.create_user(
-        username="regular_admin_test_user",
-        email="regular_admin_test_user@example.com",
-        password="password123",
-        role=UserRole.USER,
-    )
-
-    with pytest.raises(HTTPException) as exc_info:
-        await get_current_active_admin_user(current_user=user)
-
-    assert exc_info.value.status_code == 403
-    assert "sufficient privileges" in exc_info.value.detail
+@pytest.mark.parametrize(
+    "token", ["", "no-dots", "a.b", "a.b.c.d", "a..c", "a.b.c=", "a.b.c d", "a" * 9000]
+)
+def test_decode_token_rejects_malformed_without_verifying(token):
+    """Tokens that are not shaped like a JWT never reach jwt.decode."""
+    with (
+        patch("app.api.deps.jwt.decode") as decode,
+        pytest.raises(jwt.InvalidTokenError),
+    ):
+        _decode_token(token)
+    decode.assert_not_called()
+
+
+def test_ttl_cache_expiry_and_eviction():
+    """Entries expire after their TTL and the oldest entry is evicted first."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.set("expired", 4, ttl=0)
+    assert cache.get("expired") is None
+
+    with patch("app.core.cache.time.monotonic", return_value=10**9):
+        assert cache.get("a") is None
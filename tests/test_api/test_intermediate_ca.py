@@ -261,3 +261,50 @@ async def test_allow_leaf_certs_in_ca_response(superuser_client: AsyncClient):
     get_resp = await superuser_client.get(f"{settings.API_V1_STR}/cas/{root_id}")
     assert get_resp.status_code == status.HTTP_200_OK
     assert get_resp.json()["allow_leaf_certs"] is False
+
+
+@pytest.mark.asyncio
+async def test_export_chain_through_intermediate(superuser_client: AsyncClient):
+    """Chain export returns leaf, intermediate and root PEMs in order."""
+    root_resp = await superuser_client.post(
+        f"{settings.API_V1_STR}/cas/",
+        json={
+            "name": "Export Chain Root",
+            "subject_dn": "CN=Export Chain Root,O=Test,C=US",
+            "key_size": 2048,
+            "valid_days": 3650,
+        },
+    )
+    root = root_resp.json()
+
+    inter_resp = await superuser_client.post(
+        f"{settings.API_V1_STR}/cas/",
+        json={
+            "name": "Export Chain Intermediate",
+            "subject_dn": "CN=Export Chain Intermediate,O=Test,C=US",
+            "key_size": 2048,
+            "valid_days": 1825,
+            "parent_ca_id": root["id"],
+        },
+    )
+    inter = inter_resp.json()
+
+    cert_resp = await superuser_client.post(
+        f"{settings.API_V1_STR}/certificates/?ca_id={inter['id']}",
+        json={
+            "common_name": "chain-leaf.example.com",
+            "subject_dn": "CN=chain-leaf.example.com,O=Test,C=US",
+            "certificate_type": "server",
+            "key_size": 2048,
+            "valid_days": 365,
+        },
+    )
+    cert = cert_resp.json()
+
+    response = await superuser_client.get(
+        f"{settings.API_V1_STR}/export/certificate/{cert['id']}/chain"
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text == "\n".join(
+        [cert["certificate"], inter["certificate"], root["certificate"]]
+    )
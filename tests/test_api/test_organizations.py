@@ -1,11 +1,9 @@
-from pathlib import Path
-
 import pytest
 import pytest_asyncio
 from fastapi import status
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 
 from app.api import api_router
@@ -20,12 +18,12 @@ from app.db.models import User, UserRole
 from app.db.session import get_session
 
 # Test database for this specific test
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test_organizations.db"
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 # Create async engine for tests
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
-    poolclass=NullPool,
+    poolclass=StaticPool,
     connect_args={"check_same_thread": False},
 )
 
@@ -60,18 +58,10 @@ class TestAuth:
 
 @pytest_asyncio.fixture(scope="function")
 async def setup_test_db():
-    # Create the test database and tables
-    # Generate a unique database name for each test
-    db_name = f"./test_organizations_{id(setup_test_db)}.db"
-
-    # Remove test database if it exists
-    if Path(db_name).exists():
-        Path(db_name).unlink()
-
-    # Create a connection engine for this specific test
+    # Create a fresh in-memory database for this specific test
     test_engine_local = create_async_engine(
-        f"sqlite+aiosqlite:///{db_name}",
-        poolclass=NullPool,
+        TEST_DATABASE_URL,
+        poolclass=StaticPool,
         connect_args={"check_same_thread": False},
     )
 
@@ -87,13 +77,8 @@ async def setup_test_db():
     async with test_engine_local.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
     yield
-    # Clean up after tests
-    async with test_engine_local.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
-
-    # Remove test database file
-    if Path(db_name).exists():
-        Path(db_name).unlink()
+    # Closing the only connection discards the in-memory database
+    await test_engine_local.dispose()
 
 
 @pytest_asyncio.fixture
@@ -775,3 +760,48 @@ async def test_user_access_own_organization(setup_test_db):
             org_data = access_response.json()
             assert org_data["id"] == org.id
             assert org_data["name"] == org_name
+
+
+@pytest.mark.asyncio
+async def test_get_organization_users_denied_before_loading_members(setup_test_db):
+    """A caller outside the organization is refused without loading its members."""
+    from app.services.organization import OrganizationService
+    from app.services.user import UserService
+    from tests.conftest import recorded_statements
+
+    async with test_session_maker() as session:
+        org_service = OrganizationService(session)
+        own_org = await org_service.create_organization(name="Own Org")
+        other_org = await org_service.create_organization(name="Other Org")
+        user_service = UserService(session)
+        outsider = await user_service.create_user(
+            username="members_outsider",
+            email="members_outsider@example.com",
+            password="password123",
+            organization_id=own_org.id,
+        )
+        await user_service.create_user(
+            username="members_insider",
+            email="members_insider@example.com",
+            password="password123",
+            organization_id=other_org.id,
+        )
+
+        async def override_get_session():
+            yield session
+
+        app = create_test_app()
+        app.dependency_overrides[get_session] = override_get_session
+        app.dependency_overrides[get_current_active_user] = TestAuth(outsider)
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            with recorded_statements(session) as statements:
+                response = await client.get(
+                    f"/api/v1/organizations/{other_org.id}/users"
+                )
+            assert response.status_code == status.HTTP_403_FORBIDDEN
+            assert not [s for s in statements if "users" in s]
+
+            response = await client.get("/api/v1/organizations/999999/users")
+            assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -46,6 +46,49 @@ def test_cors_warns_on_wildcard_origin():
         assert s.BACKEND_CORS_ORIGINS == ["*"]
 
 
+@pytest.mark.parametrize(
+    ("rounds", "valid"),
+    [(3, False), (4, True), (31, True), (32, False)],
+    ids=["below_min", "min", "max", "above_max"],
+)
+def test_bcrypt_rounds_range(rounds, valid):
+    """BCRYPT_ROUNDS outside bcrypt's 4-31 range is rejected at load time."""
+    from pydantic import ValidationError
+
+    from app.core.config import Settings
+
+    if valid:
+        settings = Settings(BCRYPT_ROUNDS=rounds, SECRET_KEY="a" * 32)
+        assert rounds == settings.BCRYPT_ROUNDS
+        return
+    with pytest.raises(ValidationError, match="BCRYPT_ROUNDS must be between"):
+        Settings(BCRYPT_ROUNDS=rounds, SECRET_KEY="a" * 32)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("sqlite:///./fastpki.db", "sqlite+aiosqlite:///./fastpki.db"),
+        ("sqlite+aiosqlite:///./fastpki.db", "sqlite+aiosqlite:///./fastpki.db"),
+        ("postgresql://u:p@db/fastpki", "postgresql+asyncpg://u:p@db/fastpki"),
+        (
+            "postgresql+asyncpg://u:p@db/fastpki",
+            "postgresql+asyncpg://u:p@db/fastpki",
+        ),
+        (
+            "postgresql://u:sqlite@db/postgresql",
+            "postgresql+asyncpg://u:sqlite@db/postgresql",
+        ),
+    ],
+)
+def test_database_url_driver_rewrite(url, expected):
+    """Only a bare scheme is rewritten to its async driver."""
+    from app.core.config import Settings
+
+    database_url = Settings(DATABASE_URL=url, SECRET_KEY="a" * 32).DATABASE_URL
+    assert database_url == expected
+
+
 @pytest.mark.asyncio
 async def test_cors_no_middleware_when_origins_empty():
     """When CORS origins are empty, no CORS headers should be added."""
@@ -220,3 +263,18 @@ async def test_security_headers_on_api_endpoint():
         response = await client.get("/api/v1/users/me")
         assert response.headers.get("x-content-type-options") == "nosniff"
         assert response.headers.get("x-frame-options") == "DENY"
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_gzipped():
+    """Responses above the size threshold are compressed when the client allows."""
+    transport = ASGITransport(app=real_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/api/v1/openapi.json", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.headers.get("content-encoding") == "gzip"
+        assert response.headers.get("x-content-type-options") == "nosniff"
+
+        response = await client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
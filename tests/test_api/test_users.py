@@ -58,6 +58,20 @@ async def test_create_user(client):
     assert "hashed_password" not in data  # Password should not be returned
 
 
+@pytest.mark.asyncio
+async def test_create_user_short_password(client):
+    user_data = {
+        "username": "shortpass",
+        "email": "shortpass@example.com",
+        "password": "short",
+    }
+
+    response = await client.post("/api/v1/users/", json=user_data)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "password"]
+
+
 @pytest.mark.asyncio
 async def test_create_user_duplicate_username(client):
     # Create a user
@@ -155,6 +169,17 @@ async def test_get_users(client, db):
     assert "user2" in usernames
     assert "user3" in usernames
 
+    # Pages are ordered by ID and bounded
+    response = await client.get(
+        "/api/v1/users/", params={"skip": 1, "limit": 2}, headers=headers
+    )
+    assert [user["username"] for user in response.json()] == ["user1", "user2"]
+
+    response = await client.get(
+        "/api/v1/users/", params={"limit": 5000}, headers=headers
+    )
+    assert response.status_code == 422
+
 
 @pytest.mark.asyncio
 async def test_get_user_by_id(client, db):
@@ -1,19 +1,39 @@
+from contextlib import asynccontextmanager
+
 import pytest
 import pytest_asyncio
 from cryptography.fernet import Fernet
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from sqlmodel import select
 
-from app.db.models import CertificateAuthority, CertificateType
+from app.db.models import Certificate, CertificateAuthority, CertificateType
 from app.services.ca import CAService
 from app.services.cert import CertificateService
 from app.services.encryption import EncryptionService, encrypt_existing_keys
-from tests.conftest import test_engine
+from tests.conftest import test_session_maker
 
 TEST_KEY = Fernet.generate_key().decode()
 OTHER_KEY = Fernet.generate_key().decode()
 
 
+class _JoinedEngine:
+    """Stand-in engine whose ``begin()`` joins the test's open transaction."""
+
+    def __init__(self, conn: AsyncConnection):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def begin(self):
+        async with self.conn.begin_nested():
+            yield self.conn
+
+
+@pytest.fixture
+def startup_engine(setup_db: AsyncConnection, monkeypatch) -> None:
+    """Point encrypt_existing_keys at the test database."""
+    monkeypatch.setattr("app.db.session.engine", _JoinedEngine(setup_db))
+
+
 @pytest_asyncio.fixture
 async def ca_with_encryption(db: AsyncSession, monkeypatch) -> CertificateAuthority:
     monkeypatch.setattr(
@@ -103,10 +123,9 @@ async def test_cert_signing_with_encrypted_ca_key(
 
 
 @pytest.mark.asyncio
-async def test_encrypt_existing_keys_migrates(db: AsyncSession, monkeypatch):
-    # Point encrypt_existing_keys at the test engine
-    monkeypatch.setattr("app.db.session.engine", test_engine)
-
+async def test_encrypt_existing_keys_migrates(
+    db: AsyncSession, startup_engine, monkeypatch
+):
     # Create a CA with encryption disabled (plaintext key)
     monkeypatch.setattr(
         "app.services.encryption.settings.PRIVATE_KEY_ENCRYPTION_KEY", None
@@ -148,9 +167,46 @@ async def test_encrypt_existing_keys_migrates(db: AsyncSession, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_encrypt_existing_keys_idempotent(db: AsyncSession, monkeypatch):
-    monkeypatch.setattr("app.db.session.engine", test_engine)
+async def test_encrypt_existing_keys_persists_certificate_keys(
+    db: AsyncSession, startup_engine, monkeypatch
+):
+    """Keys encrypted at startup are written, not left pending in the session."""
+    monkeypatch.setattr(
+        "app.services.encryption.settings.PRIVATE_KEY_ENCRYPTION_KEY", None
+    )
+    ca = await CAService(db).create_ca(
+        name="Persisted CA",
+        subject_dn="CN=Persisted CA,O=Test,C=US",
+        key_size=2048,
+        valid_days=3650,
+    )
+    cert = await CertificateService(db).create_certificate(
+        ca_id=ca.id,
+        common_name="persisted.example.com",
+        subject_dn="CN=persisted.example.com,O=Test,C=US",
+        certificate_type=CertificateType.SERVER,
+    )
+
+    monkeypatch.setattr(
+        "app.services.encryption.settings.PRIVATE_KEY_ENCRYPTION_KEY", TEST_KEY
+    )
+    await encrypt_existing_keys()
+
+    # Read the rows back through a session that never saw the plaintext
+    async with test_session_maker() as fresh:
+        stored_ca = await fresh.get(CertificateAuthority, ca.id)
+        stored_cert = await fresh.get(Certificate, cert.id)
+    assert stored_ca is not None
+    assert EncryptionService.is_encrypted(stored_ca.private_key)
+    assert stored_cert is not None
+    assert stored_cert.private_key is not None
+    assert EncryptionService.is_encrypted(stored_cert.private_key)
+
 
+@pytest.mark.asyncio
+async def test_encrypt_existing_keys_idempotent(
+    db: AsyncSession, startup_engine, monkeypatch
+):
     # Create a CA with encryption disabled
     monkeypatch.setattr(
         "app.services.encryption.settings.PRIVATE_KEY_ENCRYPTION_KEY", None
@@ -189,10 +245,8 @@ async def test_encrypt_existing_keys_idempotent(db: AsyncSession, monkeypatch):
 
 @pytest.mark.asyncio
 async def test_encrypt_existing_keys_fails_with_wrong_key(
-    db: AsyncSession, monkeypatch
+    db: AsyncSession, startup_engine, monkeypatch
 ):
-    monkeypatch.setattr("app.db.session.engine", test_engine)
-
     # Create a CA with encryption enabled using TEST_KEY
     monkeypatch.setattr(
         "app.services.encryption.settings.PRIVATE_KEY_ENCRYPTION_KEY", TEST_KEY
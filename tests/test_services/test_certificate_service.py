@@ -1,19 +1,26 @@
 import ipaddress
+import threading
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
 from cryptography import x509
-from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed448, ed25519
 from cryptography.x509.oid import ExtendedKeyUsageOID, NameOID
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import (
+    Certificate,
     CertificateAuthority,
     CertificateStatus,
     CertificateType,
+    KeyAlgorithm,
 )
 from app.services.ca import CAService
-from app.services.cert import CertificateService
+from app.services.cert import CertificateService, _ca_material_cache
+from app.services.encryption import EncryptionService
 
 
 @pytest_asyncio.fixture
@@ -46,6 +53,7 @@ async def test_create_certificate(db: AsyncSession, test_ca: CertificateAuthorit
     assert cert.common_name == "test.example.com"
     assert cert.subject_dn == "CN=test.example.com,O=Test Organization,C=US"
     assert cert.certificate_type == CertificateType.SERVER
+    assert cert.key_algorithm == KeyAlgorithm.RSA
     assert cert.key_size == 2048
     assert cert.valid_days == 365
     assert cert.status == CertificateStatus.VALID
@@ -77,6 +85,65 @@ async def test_create_certificate_without_private_key(
     assert cert.certificate is not None
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("key_algorithm", "key_type"),
+    [
+        (KeyAlgorithm.ECDSA_P256, ec.EllipticCurvePublicKey),
+        (KeyAlgorithm.ED25519, ed25519.Ed25519PublicKey),
+    ],
+)
+async def test_create_certificate_with_elliptic_curve_key(
+    db: AsyncSession, test_ca: CertificateAuthority, key_algorithm, key_type
+):
+    """Non-RSA keys are generated on request and never assert keyEncipherment."""
+    cert_service = CertificateService(db)
+    cert = await cert_service.create_certificate(
+        ca_id=test_ca.id,
+        common_name="ec.example.com",
+        subject_dn="CN=ec.example.com",
+        certificate_type=CertificateType.SERVER,
+        key_algorithm=key_algorithm,
+    )
+
+    assert cert.key_algorithm == key_algorithm
+    assert cert.key_size == 256
+    issued = x509.load_pem_x509_certificate(cert.certificate.encode())
+    assert isinstance(issued.public_key(), key_type)
+    key_usage = issued.extensions.get_extension_for_class(x509.KeyUsage).value
+    assert key_usage.digital_signature is True
+    assert key_usage.key_encipherment is False
+    private_key = serialization.load_pem_private_key(
+        cert.private_key.encode(), password=None
+    )
+    assert private_key.public_key() == issued.public_key()
+
+
+@pytest.mark.asyncio
+async def test_key_generation_runs_off_event_loop(
+    db: AsyncSession, test_ca: CertificateAuthority, monkeypatch
+):
+    """Key pairs are generated in a worker thread, not on the event loop."""
+    generate = CAService.generate_key_pair
+    threads: list[int] = []
+
+    def recording_generate(key_size: int = 2048):
+        threads.append(threading.get_ident())
+        return generate(key_size)
+
+    monkeypatch.setattr(CAService, "generate_key_pair", recording_generate)
+    cert_service = CertificateService(db)
+    await cert_service.create_certificate(
+        ca_id=test_ca.id,
+        common_name="threaded.example.com",
+        subject_dn="CN=threaded.example.com",
+        certificate_type=CertificateType.SERVER,
+    )
+
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+
+
 @pytest.mark.asyncio
 async def test_get_certificate(db: AsyncSession, test_ca: CertificateAuthority):
     """Test retrieving a certificate by ID."""
@@ -116,6 +183,62 @@ async def test_list_certificates(db: AsyncSession, test_ca: CertificateAuthority
     assert all(cert.issuer_id == test_ca.id for cert in certs)
 
 
+@pytest.mark.asyncio
+async def test_list_certificates_skips_private_key(
+    db: AsyncSession, test_ca: CertificateAuthority
+):
+    """Listing does not load private keys."""
+    from sqlalchemy.exc import InvalidRequestError
+
+    from tests.conftest import test_session_maker
+
+    await CertificateService(db).create_certificate(
+        ca_id=test_ca.id,
+        common_name="nokey.example.com",
+        subject_dn="CN=nokey.example.com,O=Test Organization,C=US",
+        certificate_type=CertificateType.SERVER,
+    )
+
+    async with test_session_maker() as session:
+        certs = await CertificateService(session).list_certificates()
+        cas = await CAService(session).list_cas()
+
+        assert certs[0].certificate.startswith("-----BEGIN CERTIFICATE-----")
+        with pytest.raises(InvalidRequestError):
+            _ = certs[0].private_key
+        with pytest.raises(InvalidRequestError):
+            _ = cas[0].private_key
+
+
+@pytest.mark.asyncio
+async def test_ca_material_parsed_once_per_ca(
+    db: AsyncSession, test_ca: CertificateAuthority
+):
+    """Issuing twice from the same CA reuses the decrypted key and certificate."""
+    cert_service = CertificateService(db)
+    _ca_material_cache.clear()
+    with patch(
+        "app.services.cert.EncryptionService.decrypt_private_key",
+        wraps=EncryptionService.decrypt_private_key,
+    ) as decrypt:
+        for name in ("first.example.com", "second.example.com"):
+            cert = await cert_service.create_certificate(
+                ca_id=test_ca.id,
+                common_name=name,
+                subject_dn=f"CN={name}",
+                certificate_type=CertificateType.SERVER,
+                include_private_key=False,
+            )
+            issued = x509.load_pem_x509_certificate(cert.certificate.encode())
+            aki = issued.extensions.get_extension_for_class(x509.AuthorityKeyIdentifier)
+            ca_cert = x509.load_pem_x509_certificate(test_ca.certificate.encode())
+            ski = ca_cert.extensions.get_extension_for_class(x509.SubjectKeyIdentifier)
+            assert aki.value.key_identifier == ski.value.digest
+
+    decrypt.assert_called_once()
+    assert len(_ca_material_cache) == 1
+
+
 @pytest.mark.asyncio
 async def test_revoke_certificate(db: AsyncSession, test_ca: CertificateAuthority):
     """Test revoking a certificate."""
@@ -135,6 +258,9 @@ async def test_revoke_certificate(db: AsyncSession, test_ca: CertificateAuthorit
     assert revoked_cert.id == cert.id
     assert revoked_cert.status == CertificateStatus.REVOKED
     assert revoked_cert.revoked_at is not None
+    # Committed state is served from memory, nothing is left to reload
+    assert not inspect(revoked_cert).expired_attributes
+    assert revoked_cert.updated_at >= revoked_cert.created_at
 
 
 @pytest.mark.asyncio
@@ -553,6 +679,79 @@ async def test_sign_csr_uses_csr_public_key(
     assert csr_pub_bytes == cert_pub_bytes
 
 
+def _csr_for(key) -> str:
+    algorithm = (
+        None
+        if isinstance(key, ed25519.Ed25519PrivateKey | ed448.Ed448PrivateKey)
+        else hashes.SHA256()
+    )
+    csr = (
+        x509.CertificateSigningRequestBuilder()
+        .subject_name(
+            x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "key.example.com")])
+        )
+        .sign(key, algorithm)
+    )
+    return csr.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("make_key", "key_algorithm", "key_size"),
+    [
+        (lambda: CAService.generate_key_pair(2048)[0], KeyAlgorithm.RSA, 2048),
+        (
+            lambda: ec.generate_private_key(ec.SECP256R1()),
+            KeyAlgorithm.ECDSA_P256,
+            256,
+        ),
+        (ed25519.Ed25519PrivateKey.generate, KeyAlgorithm.ED25519, 256),
+    ],
+    ids=["rsa", "ecdsa_p256", "ed25519"],
+)
+async def test_sign_csr_records_csr_key_algorithm(
+    db: AsyncSession, test_ca: CertificateAuthority, make_key, key_algorithm, key_size
+):
+    """The stored key algorithm and size describe the CSR's key, not defaults."""
+    cert = await CertificateService(db).sign_csr(
+        csr_pem=_csr_for(make_key()),
+        ca_id=test_ca.id,
+        certificate_type=CertificateType.SERVER,
+    )
+
+    assert cert.key_algorithm == key_algorithm
+    assert cert.key_size == key_size
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("make_key", "key_size"),
+    [
+        (lambda: ec.generate_private_key(ec.SECP384R1()), 384),
+        (ed448.Ed448PrivateKey.generate, 448),
+    ],
+    ids=["ecdsa_p384", "ed448"],
+)
+async def test_sign_csr_records_unnamed_key_algorithm(
+    db: AsyncSession, test_ca: CertificateAuthority, make_key, key_size
+):
+    """CSR keys KeyAlgorithm cannot name are signed with a NULL algorithm."""
+    key = make_key()
+    cert = await CertificateService(db).sign_csr(
+        csr_pem=_csr_for(key),
+        ca_id=test_ca.id,
+        certificate_type=CertificateType.SERVER,
+    )
+
+    db.expunge_all()
+    stored = await db.get(Certificate, cert.id)
+    assert stored is not None
+    assert stored.key_algorithm is None
+    assert stored.key_size == key_size
+    issued = x509.load_pem_x509_certificate(stored.certificate.encode("utf-8"))
+    assert issued.public_key() == key.public_key()
+
+
 @pytest.mark.asyncio
 async def test_sign_csr_rejects_invalid_csr(
     db: AsyncSession, test_ca: CertificateAuthority
@@ -574,3 +773,14 @@ def test_parse_subject_dn_escaped_comma():
     assert cn == "Doe, John"
     org = name.get_attributes_for_oid(NameOID.ORGANIZATION_NAME)[0].value
     assert org == "Test Org"
+
+
+def test_parse_subject_dn_is_memoized():
+    """Parsing the same DN twice returns the cached Name."""
+    CAService.parse_subject_dn.cache_clear()
+    first = CAService.parse_subject_dn("CN=cached.example.com,O=Test Org")
+    second = CAService.parse_subject_dn("CN=cached.example.com,O=Test Org")
+
+    assert second is first
+    info = CAService.parse_subject_dn.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from app.services.ca import CAService
+from app.services.key_pool import KeyPool
+
+
+@pytest.fixture
+def generated(monkeypatch) -> list[tuple[object, bytes]]:
+    """Replace RSA generation with cheap sentinels and record what was made."""
+    pairs: list[tuple[object, bytes]] = []
+
+    def fake_generate(key_size: int = 2048) -> tuple[object, bytes]:
+        pair = (object(), str(key_size).encode())
+        pairs.append(pair)
+        return pair
+
+    monkeypatch.setattr(CAService, "generate_key_pair", fake_generate)
+    return pairs
+
+
+@pytest.mark.asyncio
+async def test_get_serves_pregenerated_pair(generated):
+    async def filled() -> None:
+        while len(generated) < 2:
+            await asyncio.sleep(0.01)
+
+    pool = KeyPool({2048: 2})
+    pool.start()
+    try:
+        await asyncio.wait_for(filled(), timeout=5)
+        pair = await pool.get(2048)
+    finally:
+        await pool.stop()
+
+    assert pair is generated[0]
+
+
+@pytest.mark.asyncio
+async def test_get_generates_unpooled_size_on_demand(generated):
+    pool = KeyPool({2048: 1})
+
+    pair = await pool.get(4096)
+
+    assert pair == generated[0]
+    assert pair[1] == b"4096"
+
+
+@pytest.mark.asyncio
+async def test_zero_sized_pool_is_disabled(generated):
+    pool = KeyPool({2048: 0})
+    pool.start()
+    await pool.stop()
+
+    assert generated == []
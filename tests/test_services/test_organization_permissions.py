@@ -4,6 +4,7 @@ from app.db.models import UserRole
 from app.services.exceptions import HasDependentsError
 from app.services.organization import OrganizationService
 from app.services.user import UserService
+from tests.conftest import recorded_statements
 
 
 @pytest.mark.asyncio
@@ -204,3 +205,38 @@ async def test_organization_admin_permissions(db):
     # Verify user was removed
     updated_user = await user_service.get_user_by_id(user.id)
     assert updated_user.organization_id is None
+
+
+@pytest.mark.asyncio
+async def test_remove_user_loads_admin_and_target_together(db):
+    """The admin and the target user are fetched in a single SELECT."""
+    user_service = UserService(db)
+    org_service = OrganizationService(db)
+
+    org = await org_service.create_organization(name="Single Select Org")
+    admin = await user_service.create_user(
+        username="single_select_admin",
+        email="single_select_admin@example.com",
+        password="password123",
+        role=UserRole.ADMIN,
+        organization_id=org.id,
+    )
+    user = await user_service.create_user(
+        username="single_select_user",
+        email="single_select_user@example.com",
+        password="password123",
+        organization_id=org.id,
+    )
+
+    with recorded_statements(db) as statements:
+        removed = await org_service.remove_user_from_organization(
+            user.id, admin_user_id=admin.id
+        )
+
+    assert removed.organization_id is None
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    # One lookup for both users and no refresh after the commit
+    assert len(selects) == 1
+    assert " IN " in selects[0]
+    updates = [s for s in statements if s.lstrip().upper().startswith("UPDATE")]
+    assert len(updates) == 1
@@ -20,6 +20,7 @@ async def test_create_organization(db):
     assert new_org.description == "This is a test organization"
     assert new_org.created_at is not None
     assert isinstance(new_org.created_at, datetime)
+    assert new_org.updated_at == new_org.created_at
 
 
 @pytest.mark.asyncio
@@ -205,3 +206,21 @@ async def test_get_organization_users(db):
     assert "orguser1" in usernames
     assert "orguser2" in usernames
     assert "orguser3" in usernames
+
+
+@pytest.mark.asyncio
+async def test_get_organization_with_users(db):
+    user_service = UserService(db)
+    org_service = OrganizationService(db)
+
+    org = await org_service.create_organization(name="Joined Org")
+    user = await user_service.create_user(
+        username="joineduser", email="joineduser@example.com", password="password123"
+    )
+    await org_service.add_user_to_organization(user.id, org.id)
+
+    loaded = await org_service.get_organization_with_users(org.id)
+
+    assert loaded is not None
+    assert [u.username for u in loaded.users] == ["joineduser"]
+    assert await org_service.get_organization_with_users(9999) is None
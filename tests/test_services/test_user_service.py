@@ -2,10 +2,17 @@ from datetime import UTC, datetime, timedelta
 
 import jwt
 import pytest
+from sqlalchemy import update
 
 from app.core.config import settings
-from app.db.models import UserRole
-from app.services.user import UserService, get_password_hash, verify_password
+from app.db.models import User, UserRole
+from app.services.user import (
+    UserService,
+    _user_cache,
+    get_password_hash,
+    verify_password,
+)
+from tests.conftest import recorded_statements
 
 
 @pytest.mark.asyncio
@@ -28,6 +35,7 @@ async def test_create_user(db):
     assert new_user.hashed_password != "securepassword"
     # Verify the password hash works
     assert verify_password("securepassword", new_user.hashed_password)
+    assert new_user.updated_at == new_user.created_at
 
 
 @pytest.mark.asyncio
@@ -49,6 +57,23 @@ async def test_get_user_by_id(db):
     assert user.email == "getbyid@example.com"
 
 
+@pytest.mark.asyncio
+async def test_get_user_by_id_uses_identity_map(db):
+    """A user already loaded in the session is returned without a query."""
+    user_service = UserService(db)
+    created_user = await user_service.create_user(
+        username="identitymap",
+        email="identitymap@example.com",
+        password="password123",
+    )
+
+    with recorded_statements(db) as statements:
+        user = await user_service.get_user_by_id(created_user.id)
+
+    assert user is created_user
+    assert not statements
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_username(db):
     # Create a user first
@@ -85,6 +110,24 @@ async def test_get_user_by_email(db):
     assert user.email == "getbyemail@example.com"
 
 
+@pytest.mark.asyncio
+async def test_get_registration_state(db):
+    user_service = UserService(db)
+    state = await user_service.get_registration_state("new", "new@example.com")
+    assert state == (False, False, False)
+
+    await user_service.create_user(
+        username="taken", email="taken@example.com", password="password123"
+    )
+
+    state = await user_service.get_registration_state("taken", "other@example.com")
+    assert state == (True, False, True)
+    state = await user_service.get_registration_state("other", "taken@example.com")
+    assert state == (False, True, True)
+    state = await user_service.get_registration_state("new", "new@example.com")
+    assert state == (False, False, True)
+
+
 @pytest.mark.asyncio
 async def test_password_hashing():
     # Test password hashing functions
@@ -157,6 +200,31 @@ async def test_authenticate_user(db):
     assert user is None
 
 
+@pytest.mark.asyncio
+async def test_authenticate_unknown_user_still_checks_a_password(db, monkeypatch):
+    """An unknown username costs a bcrypt check, like a wrong password does."""
+    checked: list[str] = []
+
+    def recording_verify(plain_password: str, hashed_password: str) -> bool:
+        checked.append(hashed_password)
+        return False
+
+    monkeypatch.setattr("app.services.user.verify_password", recording_verify)
+    user_service = UserService(db)
+
+    assert await user_service.authenticate_user("nobody", "anypassword") is None
+    assert len(checked) == 1
+
+
+def test_password_hash_uses_configured_rounds(monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+
+    hashed = get_password_hash("password123")
+
+    assert hashed.startswith("$2b$05$")
+    assert verify_password("password123", hashed)
+
+
 @pytest.mark.asyncio
 async def test_inactive_user_authentication(db):
     # Create a test user that is inactive
@@ -203,6 +271,26 @@ async def test_update_user(db):
     assert updated_user.is_active is False
 
 
+@pytest.mark.asyncio
+async def test_update_user_skips_reload_after_commit(db):
+    """Updating a loaded user writes one UPDATE and reads nothing back."""
+    user_service = UserService(db)
+    created_user = await user_service.create_user(
+        username="noreload",
+        email="noreload@example.com",
+        password="password123",
+    )
+
+    with recorded_statements(db) as statements:
+        updated_user = await user_service.update_user(
+            created_user.id, email="reloaded@example.com"
+        )
+
+    assert updated_user.email == "reloaded@example.com"
+    assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len([s for s in statements if s.lstrip().upper().startswith("UPDATE")]) == 1
+
+
 @pytest.mark.asyncio
 async def test_delete_user(db):
     # Create a test user
@@ -220,3 +308,79 @@ async def test_delete_user(db):
     # Verify user is deleted
     user = await user_service.get_user_by_id(created_user.id)
     assert user is None
+
+
+@pytest.mark.asyncio
+async def test_delete_user_reuses_loaded_user(db):
+    """A user already loaded in the session is not selected again."""
+    user_service = UserService(db)
+    created_user = await user_service.create_user(
+        username="deleteloaded",
+        email="deleteloaded@example.com",
+        password="password123",
+    )
+    user = await user_service.get_user_by_id(created_user.id)
+
+    with recorded_statements(db) as statements:
+        assert await user_service.delete_user(user.id) is True
+
+    assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
+@pytest.mark.asyncio
+async def test_get_cached_user_by_id_disabled_by_default(db):
+    from tests.conftest import test_session_maker
+
+    user_service = UserService(db)
+    created_user = await user_service.create_user(
+        username="uncacheduser",
+        email="uncached@example.com",
+        password="password123",
+    )
+    await user_service.get_cached_user_by_id(created_user.id)
+    assert len(_user_cache) == 0
+
+    await db.execute(
+        update(User)
+        .where(User.id == created_user.id)
+        .values(email="changed@example.com")
+    )
+    await db.commit()
+    async with test_session_maker() as other:
+        fresh = await UserService(other).get_cached_user_by_id(created_user.id)
+        assert fresh is not None
+        assert fresh.email == "changed@example.com"
+
+
+@pytest.mark.asyncio
+async def test_get_cached_user_by_id(db, monkeypatch):
+    from tests.conftest import test_session_maker
+
+    monkeypatch.setattr(_user_cache, "ttl", 60)
+    user_service = UserService(db)
+    created_user = await user_service.create_user(
+        username="cacheduser",
+        email="cached@example.com",
+        password="password123",
+    )
+    await user_service.get_cached_user_by_id(created_user.id)
+
+    # Change the row behind the service's back: the cached copy is still served
+    await db.execute(
+        update(User)
+        .where(User.id == created_user.id)
+        .values(email="changed@example.com")
+    )
+    await db.commit()
+    async with test_session_maker() as other:
+        cached = await UserService(other).get_cached_user_by_id(created_user.id)
+        assert cached is not None
+        assert cached.email == "cached@example.com"
+        assert cached in other
+
+    # Updates through the service drop the cached copy
+    await user_service.update_user(created_user.id, email="updated@example.com")
+    async with test_session_maker() as other:
+        fresh = await UserService(other).get_cached_user_by_id(created_user.id)
+        assert fresh is not None
+        assert fresh.email == "updated@example.com"